@@ -246,6 +246,10 @@ class DataManager:
         # Add derived metrics
         team_data['derived_metrics'] = self._calculate_derived_metrics(team_data)
         
+        # Flatten conference name so consumers avoid walking info -> conference -> name
+        conference = (team_data.get('info') or {}).get('conference') or {}
+        team_data['conference_name'] = conference.get('name') or ''
+        
         # Cache comprehensive data
         self.cache.cache_team_data(team_name, team_data, 'comprehensive', ttl=3600)  # 1 hour cache
         
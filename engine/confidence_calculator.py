@@ -3,14 +3,52 @@ Confidence calculator for College Football Market Edge Platform.
 Assesses the confidence level of predictions based on multiple factors.
 """
 
+import bisect
 import logging
-from typing import Dict, Any, List, Optional
+from enum import IntEnum
+from typing import Dict, Any, List, NamedTuple, Optional
 import statistics
-from datetime import datetime
 
 from config import config
 
 
+def _clamp(value: float, lower: float = 0.0, upper: float = 1.0) -> float:
+    """Clamp a score into [lower, upper] using plain comparisons."""
+    return lower if value < lower else (upper if value > upper else value)
+
+
+class PredictionType(IntEnum):
+    """Prediction types with a known edge-significance multiplier."""
+    STRONG_CONTRARIAN = 0
+    MODERATE_CONTRARIAN = 1
+    SLIGHT_CONTRARIAN = 2
+    CONSENSUS_ALIGNMENT = 3
+    NO_BETTING_DATA = 4
+    ERROR = 5
+
+
+# Edge-significance multiplier per PredictionType (reduced multipliers);
+# unlisted types fall back to 0.5
+_TYPE_MULTIPLIERS = (
+    0.9,   # STRONG_CONTRARIAN
+    0.75,  # MODERATE_CONTRARIAN
+    0.6,   # SLIGHT_CONTRARIAN
+    0.5,   # CONSENSUS_ALIGNMENT (increased from 0.3)
+    0.3,   # NO_BETTING_DATA
+    0.0    # ERROR
+)
+
+
+class ConfidenceComponents(NamedTuple):
+    """Per-dimension confidence scores, in weighting order."""
+    data_quality: float
+    factor_consensus: float
+    edge_significance: float
+    market_context: float
+    historical_performance: float
+    situational_factors: float
+
+
 class ConfidenceCalculator:
     """
     Calculates confidence scores for predictions based on multiple dimensions.
@@ -35,6 +73,18 @@ class ConfidenceCalculator:
             'situational_factors': 0.10     # Special circumstances
         }
         
+        # Weights aligned with ConfidenceComponents field order
+        self._weights_vec = tuple(
+            self.confidence_weights[name] for name in ConfidenceComponents._fields
+        )
+        self._component_names = tuple(
+            name.replace('_', ' ') for name in ConfidenceComponents._fields
+        )
+        
+        # Historical performance is not tracked yet, so it contributes a fixed
+        # neutral score; replace with a real assessment once prediction history lands
+        self._historical_baseline = 0.5
+        
         # Confidence thresholds
         self.confidence_levels = {
             'very_high': 0.85,
@@ -44,6 +94,15 @@ class ConfidenceCalculator:
             'very_low': 0.25
         }
         
+        # Sorted lower bounds for bisect classification; anything below 'low' is Very Low
+        self._level_thresholds = (
+            self.confidence_levels['low'],
+            self.confidence_levels['medium'],
+            self.confidence_levels['high'],
+            self.confidence_levels['very_high']
+        )
+        self._level_labels = ('Very Low', 'Low', 'Medium', 'High', 'Very High')
+        
         # Logging
         self.logger = logging.getLogger(__name__)
         
@@ -51,7 +110,8 @@ class ConfidenceCalculator:
     
     def calculate_confidence(self, prediction_result: Dict[str, Any], 
                            factor_results: Dict[str, Any],
-                           context: Dict[str, Any]) -> Dict[str, Any]:
+                           context: Dict[str, Any],
+                           with_explanation: bool = True) -> Dict[str, Any]:
         """
         Calculate comprehensive confidence assessment for a prediction.
         
@@ -59,60 +119,96 @@ class ConfidenceCalculator:
             prediction_result: Results from prediction engine
             factor_results: Results from factor calculations
             context: Game context and data
+            with_explanation: Include the component breakdown and the formatted
+                'confidence_percentage'/'explanation' strings; disable when only
+                the score and level are needed
             
         Returns:
             Dictionary with confidence score and breakdown
         """
-        confidence_components = {}
-        
-        # 1. Data quality assessment
-        confidence_components['data_quality'] = self._assess_data_quality(context, factor_results)
-        
-        # 2. Factor consensus assessment
-        confidence_components['factor_consensus'] = self._assess_factor_consensus(factor_results)
+        # Failed predictions carry no edge to assess; skip straight to the floor
+        prediction_type = prediction_result.get('prediction_type')
+        if prediction_type == 'ERROR' or prediction_type is PredictionType.ERROR:
+            return self._error_confidence(with_explanation)
         
-        # 3. Edge significance assessment
-        confidence_components['edge_significance'] = self._assess_edge_significance(prediction_result)
-        
-        # 4. Market context assessment
-        confidence_components['market_context'] = self._assess_market_context(prediction_result, context)
-        
-        # 5. Historical performance assessment (placeholder)
-        confidence_components['historical_performance'] = self._assess_historical_performance(prediction_result)
+        # Context fields shared by several assessments
+        has_betting_data = context.get('vegas_spread') is not None
+        week = context.get('week')
+        is_major_conference = self._is_major_conference_game(
+            context.get('home_team_data', {}), context.get('away_team_data', {})
+        )
         
-        # 6. Situational factors assessment
-        confidence_components['situational_factors'] = self._assess_situational_factors(context, factor_results)
+        confidence_components = ConfidenceComponents(
+            # 1. Data quality assessment
+            data_quality=self._assess_data_quality(context, factor_results, has_betting_data),
+            # 2. Factor consensus assessment
+            factor_consensus=self._assess_factor_consensus(factor_results),
+            # 3. Edge significance assessment
+            edge_significance=self._assess_edge_significance(prediction_result),
+            # 4. Market context assessment
+            market_context=self._assess_market_context(has_betting_data, week, is_major_conference),
+            # 5. Historical performance (neutral placeholder)
+            historical_performance=self._historical_baseline,
+            # 6. Situational factors assessment
+            situational_factors=self._assess_situational_factors(week, factor_results)
+        )
         
         # Calculate weighted confidence score
         total_confidence = sum(
-            score * self.confidence_weights[component]
-            for component, score in confidence_components.items()
+            score * weight for score, weight in zip(confidence_components, self._weights_vec)
         )
         
         # Apply early season volatility dampener (Weeks 1-3)
-        week = context.get('week', 4)
-        if week <= 3:
+        if week is not None and week <= 3:
             # Reduce confidence by 10-15% for early season games
             early_season_multiplier = 0.85 if week == 1 else (0.87 if week == 2 else 0.90)
             total_confidence *= early_season_multiplier
             self.logger.debug(f"Applied early season dampener for Week {week}: {early_season_multiplier}")
         
         # Ensure confidence is within reasonable bounds (15% to 85% max for better calibration)
-        final_confidence = max(0.15, min(0.85, total_confidence))
+        final_confidence = _clamp(total_confidence, 0.15, 0.85)
         
         # Determine confidence level
         confidence_level = self._determine_confidence_level(final_confidence)
         
-        return {
+        assessment = {
             'confidence_score': final_confidence,
             'confidence_level': confidence_level,
-            'confidence_percentage': f"{final_confidence:.1%}",
-            'components': confidence_components,
-            'weights': self.confidence_weights,
-            'explanation': self._generate_confidence_explanation(final_confidence, confidence_components)
+            'weights': self.confidence_weights
         }
+        
+        if with_explanation:
+            assessment['components'] = confidence_components._asdict()
+            assessment['confidence_percentage'] = f"{final_confidence:.1%}"
+            assessment['explanation'] = self._generate_confidence_explanation(
+                final_confidence, confidence_components, confidence_level
+            )
+        
+        return assessment
     
-    def _assess_data_quality(self, context: Dict[str, Any], factor_results: Dict[str, Any]) -> float:
+    def _error_confidence(self, with_explanation: bool = True) -> Dict[str, Any]:
+        """Minimum-confidence assessment for predictions that failed to generate."""
+        min_confidence = 0.15
+        confidence_level = self._determine_confidence_level(min_confidence)
+        
+        assessment = {
+            'confidence_score': min_confidence,
+            'confidence_level': confidence_level,
+            'weights': self.confidence_weights
+        }
+        
+        if with_explanation:
+            assessment['components'] = dict.fromkeys(ConfidenceComponents._fields, 0.0)
+            assessment['confidence_percentage'] = f"{min_confidence:.1%}"
+            assessment['explanation'] = (
+                f"{confidence_level} confidence ({min_confidence:.1%}). "
+                f"Prediction failed to generate; confidence not assessed."
+            )
+        
+        return assessment
+    
+    def _assess_data_quality(self, context: Dict[str, Any], factor_results: Dict[str, Any],
+                             has_betting_data: bool) -> float:
         """Assess data quality and completeness."""
         quality_score = 0.0
         
@@ -129,14 +225,13 @@ class ConfidenceCalculator:
         
         # Data source diversity
         data_sources = context.get('data_sources', [])
-        source_diversity = min(len(data_sources) / 3, 1.0)  # Normalize to 3 sources
+        source_diversity = _clamp(len(data_sources) / 3)  # Normalize to 3 sources
         quality_score += source_diversity * 0.2
         
         # Betting data availability
-        has_betting_data = context.get('vegas_spread') is not None
         quality_score += 0.1 if has_betting_data else 0.0
         
-        return min(quality_score, 1.0)
+        return _clamp(quality_score)
     
     def _assess_factor_consensus(self, factor_results: Dict[str, Any]) -> float:
         """Assess how much the factors agree with each other."""
@@ -144,16 +239,20 @@ class ConfidenceCalculator:
         if not factors:
             return 0.5  # Neutral if no factors
         
-        # Get factor values and weights
-        factor_values = []
-        factor_weights = []
+        # Get factor values and weights into buffers sized for every factor,
+        # then trim to the successful ones
+        factor_values = [0.0] * len(factors)
+        factor_weights = [0.0] * len(factors)
+        count = 0
         
-        for factor_name, factor_result in factors.items():
+        for factor_result in factors.values():
             if factor_result.get('success', False):
-                value = factor_result.get('value', 0.0)
-                weight = factor_result.get('weight', 0.0)
-                factor_values.append(value)
-                factor_weights.append(weight)
+                factor_values[count] = factor_result.get('value', 0.0)
+                factor_weights[count] = factor_result.get('weight', 0.0)
+                count += 1
+        
+        del factor_values[count:]
+        del factor_weights[count:]
         
         if len(factor_values) < 2:
             return 0.5  # Need at least 2 factors for consensus
@@ -175,7 +274,7 @@ class ConfidenceCalculator:
         if len(factor_values) > 1:
             std_dev = statistics.stdev(factor_values)
             # Lower std dev = higher consensus (invert and normalize)
-            magnitude_consensus = max(0, 1 - (std_dev / 2.0))  # Assume std dev > 2 is low consensus
+            magnitude_consensus = _clamp(1 - (std_dev / 2.0))  # Assume std dev > 2 is low consensus
             consensus_score += magnitude_consensus * 0.3
         
         # 3. Weight-adjusted agreement
@@ -186,7 +285,7 @@ class ConfidenceCalculator:
         else:
             consensus_score += 0.1  # Neutral if no weights
         
-        return min(consensus_score, 1.0)
+        return _clamp(consensus_score)
     
     def _assess_edge_significance(self, prediction_result: Dict[str, Any]) -> float:
         """Assess the significance of the identified edge with recalibrated scoring."""
@@ -214,33 +313,28 @@ class ConfidenceCalculator:
         else:
             base_significance = 0.25  # No meaningful edge
         
-        # Adjust based on prediction type (reduced multipliers)
-        type_adjustments = {
-            'STRONG_CONTRARIAN': 0.9,
-            'MODERATE_CONTRARIAN': 0.75,
-            'SLIGHT_CONTRARIAN': 0.6,
-            'CONSENSUS_ALIGNMENT': 0.5,  # Increased from 0.3
-            'NO_BETTING_DATA': 0.3,
-            'ERROR': 0.0
-        }
-        
-        type_multiplier = type_adjustments.get(prediction_type, 0.5)
+        # Adjust based on prediction type (reduced multipliers); callers passing
+        # the type name rather than a PredictionType still pay a name lookup
+        if isinstance(prediction_type, PredictionType):
+            type_index = prediction_type
+        else:
+            type_index = PredictionType.__members__.get(prediction_type)
+        type_multiplier = 0.5 if type_index is None else _TYPE_MULTIPLIERS[type_index]
         
         return base_significance * type_multiplier
     
-    def _assess_market_context(self, prediction_result: Dict[str, Any], context: Dict[str, Any]) -> float:
+    def _assess_market_context(self, has_betting_data: bool, week: Optional[int],
+                               is_major_conference: bool) -> float:
         """Assess market context and efficiency indicators."""
         market_score = 0.5  # Start with neutral
         
         # Betting line availability suggests efficient market
-        has_betting_data = context.get('vegas_spread') is not None
         if has_betting_data:
             market_score += 0.2
         else:
             market_score -= 0.1  # Less efficient market without betting lines
         
         # Game timing (earlier in season = less efficient markets)
-        week = context.get('week')
         if week:
             if week <= 3:
                 market_score += 0.1  # Early season inefficiencies
@@ -249,24 +343,14 @@ class ConfidenceCalculator:
         
         # Conference and team visibility (placeholder)
         # Major conference games have more efficient markets
-        home_team_data = context.get('home_team_data', {})
-        away_team_data = context.get('away_team_data', {})
-        
-        # Estimate market efficiency based on team info
-        if self._is_major_conference_game(home_team_data, away_team_data):
+        if is_major_conference:
             market_score -= 0.1  # More efficient market
         else:
             market_score += 0.1  # Potentially less efficient
         
-        return max(0.0, min(1.0, market_score))
-    
-    def _assess_historical_performance(self, prediction_result: Dict[str, Any]) -> float:
-        """Assess historical performance of similar predictions (placeholder)."""
-        # This would track accuracy of previous predictions with similar characteristics
-        # For now, return neutral score
-        return 0.5
+        return _clamp(market_score)
     
-    def _assess_situational_factors(self, context: Dict[str, Any], factor_results: Dict[str, Any]) -> float:
+    def _assess_situational_factors(self, week: Optional[int], factor_results: Dict[str, Any]) -> float:
         """Assess special situational factors that affect confidence."""
         situation_score = 0.5  # Start neutral
         
@@ -288,14 +372,13 @@ class ConfidenceCalculator:
             situation_score += 0.1  # Coaching experience is more predictable
         
         # Week timing
-        week = context.get('week')
         if week:
             if 4 <= week <= 11:  # Mid-season is most predictable
                 situation_score += 0.1
             elif week <= 2 or week >= 14:  # Early season and championship time less predictable
                 situation_score -= 0.1
         
-        return max(0.0, min(1.0, situation_score))
+        return _clamp(situation_score)
     
     def _is_major_conference_game(self, home_team_data: Dict, away_team_data: Dict) -> bool:
         """Check if this is a major conference game (more efficient markets)."""
@@ -309,32 +392,50 @@ class ConfidenceCalculator:
     
     def _determine_confidence_level(self, confidence_score: float) -> str:
         """Determine confidence level based on score."""
-        if confidence_score >= self.confidence_levels['very_high']:
-            return 'Very High'
-        elif confidence_score >= self.confidence_levels['high']:
-            return 'High'
-        elif confidence_score >= self.confidence_levels['medium']:
-            return 'Medium'
-        elif confidence_score >= self.confidence_levels['low']:
-            return 'Low'
-        else:
-            return 'Very Low'
+        return self._level_labels[bisect.bisect_right(self._level_thresholds, confidence_score)]
     
     def _generate_confidence_explanation(self, confidence_score: float, 
-                                       components: Dict[str, float]) -> str:
+                                       components: ConfidenceComponents,
+                                       level: Optional[str] = None) -> str:
         """Generate human-readable explanation of confidence assessment."""
-        level = self._determine_confidence_level(confidence_score)
-        
-        # Find strongest and weakest components
-        strongest_component = max(components.items(), key=lambda x: x[1])
-        weakest_component = min(components.items(), key=lambda x: x[1])
-        
-        explanation = f"{level} confidence ({confidence_score:.1%}). "
-        explanation += f"Strongest factor: {strongest_component[0].replace('_', ' ')} ({strongest_component[1]:.1%}). "
-        explanation += f"Weakest factor: {weakest_component[0].replace('_', ' ')} ({weakest_component[1]:.1%})."
+        if level is None:
+            level = self._determine_confidence_level(confidence_score)
+        
+        # Find strongest and weakest components in a single pass
+        strongest_idx = weakest_idx = 0
+        strongest = weakest = components[0]
+        for idx in range(1, len(components)):
+            score = components[idx]
+            if score > strongest:
+                strongest, strongest_idx = score, idx
+            elif score < weakest:
+                weakest, weakest_idx = score, idx
+        
+        names = self._component_names
+        explanation = (
+            f"{level} confidence ({confidence_score:.1%}). "
+            f"Strongest factor: {names[strongest_idx]} ({strongest:.1%}). "
+            f"Weakest factor: {names[weakest_idx]} ({weakest:.1%})."
+        )
         
         return explanation
 
 
-# Global confidence calculator instance
-confidence_calculator = ConfidenceCalculator()
\ No newline at end of file
+# Global confidence calculator instance, created on first use
+_confidence_calculator = None
+
+def get_confidence_calculator() -> ConfidenceCalculator:
+    """Get global confidence calculator instance."""
+    global _confidence_calculator
+    
+    if _confidence_calculator is None:
+        _confidence_calculator = ConfidenceCalculator()
+    
+    return _confidence_calculator
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the module-level ``confidence_calculator`` lazily."""
+    if name == 'confidence_calculator':
+        return get_confidence_calculator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
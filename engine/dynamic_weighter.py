@@ -3,12 +3,94 @@ Dynamic Factor Weighting System for College Football Market Edge Platform.
 Automatically adjusts factor weights based on performance and seasonal patterns.
 """
 
+import functools
 import logging
 import json
+import os
+import tempfile
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+from dataclasses import dataclass
 from datetime import datetime
-import statistics
+from types import MappingProxyType
+
+# orjson is optional; fall back to the standard library when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@dataclass(slots=True)
+class MatchedPrediction:
+    """A prediction paired with its graded result."""
+    prediction: Dict[str, Any]
+    result: Dict[str, Any]
+    correct: bool
+    factors: Dict[str, float]
+
+
+# Factor categories for specialized weighting
+FACTOR_CATEGORIES = MappingProxyType({
+    'primary': frozenset({'coaching_differential', 'experience_differential', 'situational_context'}),
+    'secondary': frozenset({'momentum_factors', 'desperation_index', 'revenge_game'}),
+    'market': frozenset({'market_efficiency', 'line_movement', 'public_sentiment'}),
+    'temporal': frozenset({'week_factor', 'rest_advantage', 'travel_distance'})
+})
+
+# Conference-name keywords mapped to adjustment keys, checked in order
+CONFERENCE_KEYWORDS = (
+    ('SEC', 'SEC'),
+    ('BIG TEN', 'BIG_TEN'),
+    ('BIG 10', 'BIG_TEN'),
+    ('BIG 12', 'BIG_12'),
+    ('ACC', 'ACC'),
+    ('PAC', 'PAC_12')
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _classify_conference(conf_name: str) -> str:
+    """Map a raw conference name to its standard adjustment key."""
+    conf_name = conf_name.upper()
+    
+    # Map to standard conference names; first keyword match wins
+    for keyword, conference in CONFERENCE_KEYWORDS:
+        if keyword in conf_name:
+            return conference
+    
+    return 'OTHER'
+
+
+def _performance_multiplier(accuracy: float, predictive_power: float) -> float:
+    """Weight multiplier from a factor's tracked accuracy and predictive power."""
+    # Adjust based on accuracy
+    if accuracy > 0.6:
+        multiplier = 1 + (accuracy - 0.5) * 0.4  # Up to 1.4x for 90% accuracy
+    elif accuracy < 0.4:
+        multiplier = 0.7 + accuracy * 0.6  # Down to 0.7x for 10% accuracy
+    else:
+        multiplier = 1.0
+    
+    # Further adjust based on predictive power
+    return multiplier * (1 + predictive_power * 0.2)
+
+
+def _adjusted_weight(current_weight: float, accuracy: float,
+                     predictive_power: float, learning_rate: float) -> float:
+    """New base weight for a factor given its performance over a batch of results."""
+    # Base adjustment on accuracy vs 50%
+    accuracy_adjustment = (accuracy - 0.5) * 2  # -1 to 1 range
+    
+    # Adjust based on predictive power
+    power_adjustment = predictive_power * 0.5
+    
+    # Combine adjustments and apply to current weight
+    new_weight = current_weight * (1 + (accuracy_adjustment + power_adjustment) * learning_rate)
+    
+    # Ensure reasonable bounds
+    return 0.01 if new_weight < 0.01 else (0.5 if new_weight > 0.5 else new_weight)
 
 
 class DynamicWeighter:
@@ -23,6 +105,20 @@ class DynamicWeighter:
     - Continuous learning and improvement
     """
     
+    # Factor categories for specialized weighting
+    factor_categories = FACTOR_CATEGORIES
+    
+    # Combined context multipliers for every (season, conference, prediction type);
+    # built on first use and dropped whenever the weight state changes
+    _multiplier_cache: Optional[Dict[tuple, Dict[str, float]]] = None
+    
+    # Per-factor multipliers derived from performance_tracking; built lazily and
+    # dropped whenever the weight state changes
+    _performance_multipliers: Optional[Dict[str, float]] = None
+    
+    # Whether weight_state has unsaved changes
+    _dirty = False
+    
     def __init__(self):
         """Initialize dynamic weighter."""
         self.logger = logging.getLogger(__name__)
@@ -39,14 +135,6 @@ class DynamicWeighter:
         self.min_samples_for_adjustment = 15  # Minimum games before adjusting
         self.stability_threshold = 0.1  # Don't adjust if change < 10%
         
-        # Factor categories for specialized weighting
-        self.factor_categories = {
-            'primary': ['coaching_differential', 'experience_differential', 'situational_context'],
-            'secondary': ['momentum_factors', 'desperation_index', 'revenge_game'],
-            'market': ['market_efficiency', 'line_movement', 'public_sentiment'],
-            'temporal': ['week_factor', 'rest_advantage', 'travel_distance']
-        }
-        
         self.logger.info("Dynamic Weighter initialized")
     
     def get_optimized_weights(self, context: Dict[str, Any]) -> Dict[str, float]:
@@ -59,32 +147,48 @@ class DynamicWeighter:
         Returns:
             Optimized factor weights
         """
-        try:
-            # Start with base weights
-            weights = self._get_base_weights()
-            
-            # Apply seasonal adjustments
-            seasonal_weights = self._apply_seasonal_adjustments(weights, context)
-            
-            # Apply conference-specific adjustments
-            conf_weights = self._apply_conference_adjustments(seasonal_weights, context)
-            
-            # Apply prediction type adjustments
-            type_weights = self._apply_prediction_type_adjustments(conf_weights, context)
-            
-            # Apply recent performance adjustments
-            performance_weights = self._apply_performance_adjustments(type_weights, context)
-            
-            # Normalize weights to maintain total
-            final_weights = self._normalize_weights(performance_weights)
+        if not isinstance(context, dict):
+            return self._get_base_weights()
+        
+        final_weights = self._compose_weights(self._get_context_multipliers(context))
+        
+        self.logger.debug(f"Optimized weights for context: {final_weights}")
+        
+        return final_weights
+    
+    def get_optimized_weights_batch(self, contexts: List[Dict[str, Any]]) -> List[Dict[str, float]]:
+        """
+        Get optimized factor weights for many contexts in one call.
+        
+        Contexts sharing a season, conference and prediction type receive the
+        same weights, so each distinct combination is only composed once.
+        
+        Args:
+            contexts: Game and prediction contexts
             
-            self.logger.debug(f"Optimized weights for context: {final_weights}")
+        Returns:
+            Optimized factor weights for each context, in input order
+        """
+        if self._multiplier_cache is None:
+            self._multiplier_cache = self._build_multiplier_table()
+        
+        weights_by_key = {}
+        batch_weights = []
+        
+        for context in contexts:
+            if not isinstance(context, dict):
+                batch_weights.append(self._get_base_weights())
+                continue
             
-            return final_weights
+            key = self._get_context_key(context)
+            weights = weights_by_key.get(key)
+            if weights is None:
+                weights = weights_by_key[key] = self._compose_weights(self._multiplier_cache[key])
             
-        except Exception as e:
-            self.logger.error(f"Error getting optimized weights: {e}")
-            return self._get_base_weights()
+            # Each context gets its own dict so callers can adjust weights independently
+            batch_weights.append(weights.copy())
+        
+        return batch_weights
     
     def update_weights_from_results(self, predictions: List[Dict], 
                                    results: List[Dict]) -> Dict[str, Any]:
@@ -98,54 +202,52 @@ class DynamicWeighter:
         Returns:
             Update summary
         """
-        try:
-            update_summary = {
-                'predictions_processed': 0,
-                'weight_changes': {},
-                'performance_metrics': {},
-                'adjustment_applied': False
-            }
-            
-            # Match predictions with results
-            matched_data = self._match_predictions_with_results(predictions, results)
-            update_summary['predictions_processed'] = len(matched_data)
-            
-            if len(matched_data) < self.min_samples_for_adjustment:
-                update_summary['message'] = f"Need {self.min_samples_for_adjustment} samples, got {len(matched_data)}"
-                return update_summary
-            
-            # Analyze factor performance
-            factor_performance = self._analyze_factor_performance(matched_data)
-            update_summary['performance_metrics'] = factor_performance
-            
-            # Calculate weight adjustments
-            weight_adjustments = self._calculate_weight_adjustments(factor_performance)
-            update_summary['weight_changes'] = weight_adjustments
-            
-            # Apply significant adjustments
-            if self._should_apply_adjustments(weight_adjustments):
-                self._apply_weight_adjustments(weight_adjustments)
-                self._save_weight_state()
-                update_summary['adjustment_applied'] = True
-                self.logger.info("Applied dynamic weight adjustments")
-            else:
-                update_summary['message'] = "Weight changes below significance threshold"
-            
+        update_summary = {
+            'predictions_processed': 0,
+            'weight_changes': {},
+            'performance_metrics': {},
+            'adjustment_applied': False
+        }
+        
+        # Match predictions with results
+        matched_data = self._match_predictions_with_results(predictions, results)
+        update_summary['predictions_processed'] = len(matched_data)
+        
+        if len(matched_data) < self.min_samples_for_adjustment:
+            update_summary['message'] = f"Need {self.min_samples_for_adjustment} samples, got {len(matched_data)}"
             return update_summary
-            
-        except Exception as e:
-            self.logger.error(f"Error updating weights from results: {e}")
-            return {'error': str(e)}
+        
+        # Analyze factor performance
+        factor_performance = self._analyze_factor_performance(matched_data)
+        update_summary['performance_metrics'] = factor_performance
+        
+        # Calculate weight adjustments
+        weight_adjustments = self._calculate_weight_adjustments(factor_performance)
+        update_summary['weight_changes'] = weight_adjustments
+        
+        # Apply significant adjustments
+        if self._should_apply_adjustments(weight_adjustments):
+            self._apply_weight_adjustments(weight_adjustments)
+            self._save_weight_state()
+            update_summary['adjustment_applied'] = True
+            self.logger.info("Applied dynamic weight adjustments")
+        else:
+            update_summary['message'] = "Weight changes below significance threshold"
+        
+        return update_summary
     
     def _load_weight_state(self) -> Dict[str, Any]:
         """Load saved weight state or initialize new one."""
         if self.weights_file.exists():
             try:
-                with open(self.weights_file) as f:
-                    state = json.load(f)
-                    self.logger.info("Loaded existing weight state")
-                    return state
-            except Exception as e:
+                if ORJSON_AVAILABLE:
+                    state = orjson.loads(self.weights_file.read_bytes())
+                else:
+                    with open(self.weights_file) as f:
+                        state = json.load(f)
+                self.logger.info("Loaded existing weight state")
+                return state
+            except (OSError, ValueError) as e:
                 self.logger.error(f"Error loading weight state: {e}")
         
         # Initialize new weight state
@@ -208,110 +310,139 @@ class DynamicWeighter:
         }
     
     def _save_weight_state(self):
-        """Save weight state to disk."""
+        """Save weight state to disk if it changed since the last save."""
+        if not self._dirty:
+            return
+        
         try:
             self.weight_state['last_updated'] = datetime.now().isoformat()
-            with open(self.weights_file, 'w') as f:
-                json.dump(self.weight_state, f, indent=2)
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(self.weight_state, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.weight_state, indent=2).encode('utf-8')
+            
+            # Write to a temp file beside the target and swap it in, so a crash
+            # mid-write never leaves a truncated weight state behind
+            fd, temp_path = tempfile.mkstemp(dir=self.weights_file.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(temp_path, self.weights_file)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+            
+            self._dirty = False
             self.logger.info("Weight state saved")
-        except Exception as e:
+        except (OSError, TypeError, ValueError) as e:
             self.logger.error(f"Error saving weight state: {e}")
     
     def _get_base_weights(self) -> Dict[str, float]:
         """Get current base weights."""
         return self.weight_state['base_weights'].copy()
     
-    def _apply_seasonal_adjustments(self, weights: Dict[str, float], 
-                                   context: Dict[str, Any]) -> Dict[str, float]:
-        """Apply seasonal weight adjustments."""
-        week = context.get('week', 4)
+    def _get_context_multipliers(self, context: Dict[str, Any]) -> Dict[str, float]:
+        """Get combined seasonal, conference and prediction type multipliers for a context."""
+        if self._multiplier_cache is None:
+            self._multiplier_cache = self._build_multiplier_table()
         
-        if week <= 3:
-            season_key = 'early_season'
-        elif week >= 12:
-            season_key = 'late_season'
-        else:
-            season_key = 'mid_season'
+        return self._multiplier_cache[self._get_context_key(context)]
+    
+    def _get_context_key(self, context: Dict[str, Any]) -> tuple:
+        """Get the (season, conference, prediction type) multiplier table key for a context."""
+        week = context.get('week')
+        season_key = self._get_season_key(4 if week is None else week)
+        primary_conf = self._get_primary_conference(context)
+        prediction_type = context.get('prediction_type', 'CONSENSUS_ALIGNMENT')
         
-        adjustments = self.weight_state['seasonal_adjustments'].get(season_key, {})
+        # Conferences and prediction types without adjustments share the None entry
+        if primary_conf not in self.weight_state['conference_adjustments']:
+            primary_conf = None
+        if prediction_type not in self.weight_state['prediction_type_weights']:
+            prediction_type = None
         
-        adjusted_weights = weights.copy()
-        for factor, multiplier in adjustments.items():
-            if factor in adjusted_weights:
-                adjusted_weights[factor] *= multiplier
+        return (season_key, primary_conf, prediction_type)
+    
+    def _compose_weights(self, multipliers: Dict[str, float]) -> Dict[str, float]:
+        """Apply context and performance multipliers to the base weights and normalize."""
+        performance_multipliers = self._get_performance_multipliers()
+        
+        # Apply seasonal, conference, prediction type and recent performance
+        # adjustments to the base weights in a single pass
+        weights = {
+            factor: weight * multipliers.get(factor, 1.0) * performance_multipliers.get(factor, 1.0)
+            for factor, weight in self.weight_state['base_weights'].items()
+        }
         
-        return adjusted_weights
+        # Normalize weights to maintain total
+        return self._normalize_weights(weights)
+    
+    def _build_multiplier_table(self) -> Dict[tuple, Dict[str, float]]:
+        """Combine every season x conference x prediction type adjustment set up front."""
+        seasonal = self.weight_state['seasonal_adjustments']
+        conference = self.weight_state['conference_adjustments']
+        prediction_type = self.weight_state['prediction_type_weights']
+        
+        table = {}
+        
+        for season_key in ('early_season', 'mid_season', 'late_season'):
+            for conf_key in [*conference, None]:
+                for type_key in [*prediction_type, None]:
+                    combined = {}
+                    adjustment_sets = (
+                        seasonal.get(season_key, {}),
+                        conference.get(conf_key, {}),
+                        prediction_type.get(type_key, {})
+                    )
+                    for adjustments in adjustment_sets:
+                        for factor, multiplier in adjustments.items():
+                            combined[factor] = combined.get(factor, 1.0) * multiplier
+                    table[(season_key, conf_key, type_key)] = combined
+        
+        return table
+    
+    def _invalidate_weight_caches(self):
+        """Drop cached context and performance multipliers after the weight state changes."""
+        self._multiplier_cache = None
+        self._performance_multipliers = None
+    
+    def _get_season_key(self, week: int) -> str:
+        """Map a week number to its seasonal adjustment bucket."""
+        if week <= 3:
+            return 'early_season'
+        elif week >= 12:
+            return 'late_season'
+        else:
+            return 'mid_season'
     
-    def _apply_conference_adjustments(self, weights: Dict[str, float], 
-                                     context: Dict[str, Any]) -> Dict[str, float]:
-        """Apply conference-specific adjustments."""
-        # Determine primary conference
+    def _get_primary_conference(self, context: Dict[str, Any]) -> Optional[str]:
+        """Determine primary conference, preferring the home team's."""
         home_conf = self._extract_conference(context.get('home_team_data', {}))
         away_conf = self._extract_conference(context.get('away_team_data', {}))
         
-        # Use home team's conference as primary
-        primary_conf = home_conf or away_conf
-        
-        if not primary_conf:
-            return weights
-        
-        adjustments = self.weight_state['conference_adjustments'].get(primary_conf, {})
-        
-        adjusted_weights = weights.copy()
-        for factor, multiplier in adjustments.items():
-            if factor in adjusted_weights:
-                adjusted_weights[factor] *= multiplier
-        
-        return adjusted_weights
+        return home_conf or away_conf
     
-    def _apply_prediction_type_adjustments(self, weights: Dict[str, float], 
-                                          context: Dict[str, Any]) -> Dict[str, float]:
-        """Apply prediction type specific adjustments."""
-        prediction_type = context.get('prediction_type', 'CONSENSUS_ALIGNMENT')
-        
-        adjustments = self.weight_state['prediction_type_weights'].get(prediction_type, {})
-        
-        adjusted_weights = weights.copy()
-        for factor, multiplier in adjustments.items():
-            if factor in adjusted_weights:
-                adjusted_weights[factor] *= multiplier
-        
-        return adjusted_weights
-    
-    def _apply_performance_adjustments(self, weights: Dict[str, float], 
-                                      context: Dict[str, Any]) -> Dict[str, float]:
-        """Apply recent performance-based adjustments."""
-        performance_data = self.weight_state.get('performance_tracking', {})
-        
-        if not performance_data:
-            return weights
-        
-        adjusted_weights = weights.copy()
-        
-        for factor, weight in weights.items():
-            factor_perf = performance_data.get(factor, {})
+    def _get_performance_multipliers(self) -> Dict[str, float]:
+        """Get weight multipliers for factors with enough tracked performance."""
+        if self._performance_multipliers is None:
+            performance_data = self.weight_state.get('performance_tracking', {})
             
-            if factor_perf.get('sample_size', 0) >= 10:
-                accuracy = factor_perf.get('accuracy', 0.5)
-                predictive_power = factor_perf.get('predictive_power', 0.0)
-                
-                # Adjust based on accuracy
-                if accuracy > 0.6:
-                    multiplier = 1 + (accuracy - 0.5) * 0.4  # Up to 1.4x for 90% accuracy
-                elif accuracy < 0.4:
-                    multiplier = 0.7 + accuracy * 0.6  # Down to 0.7x for 10% accuracy
-                else:
-                    multiplier = 1.0
-                
-                # Further adjust based on predictive power
-                multiplier *= (1 + predictive_power * 0.2)
-                
-                adjusted_weights[factor] *= multiplier
+            self._performance_multipliers = {
+                factor: _performance_multiplier(
+                    factor_perf.get('accuracy', 0.5),
+                    factor_perf.get('predictive_power', 0.0)
+                )
+                for factor, factor_perf in performance_data.items()
+                if factor_perf.get('sample_size', 0) >= 10
+            }
         
-        return adjusted_weights
+        return self._performance_multipliers
     
     def _normalize_weights(self, weights: Dict[str, float]) -> Dict[str, float]:
-        """Normalize weights to maintain total weight sum."""
+        """Normalize weights to maintain total weight sum.
+        
+        Weights that already sum to 1.0 are returned as the same dict, not a copy.
+        """
         total_weight = sum(weights.values())
         
         if total_weight <= 0:
@@ -319,86 +450,87 @@ class DynamicWeighter:
             equal_weight = 1.0 / len(weights)
             return {factor: equal_weight for factor in weights}
         
-        # Normalize to original sum (typically 1.0)
-        normalization_factor = 1.0 / total_weight
+        # Already normalized; hand the weights back untouched
+        if abs(total_weight - 1.0) < 1e-9:
+            return weights
         
-        return {factor: weight * normalization_factor 
-                for factor, weight in weights.items()}
+        # Normalize to original sum (typically 1.0)
+        return {factor: weight / total_weight for factor, weight in weights.items()}
     
     def _match_predictions_with_results(self, predictions: List[Dict], 
-                                       results: List[Dict]) -> List[Dict]:
+                                       results: List[Dict]) -> List[MatchedPrediction]:
         """Match predictions with their results."""
+        # Index results by matchup once; the first result for a matchup wins
+        results_by_game = {}
+        for result in results:
+            results_by_game.setdefault(self._game_key(result), result)
+        
         matched = []
         
         for pred in predictions:
-            for result in results:
-                if self._predictions_match(pred, result):
-                    matched.append({
-                        'prediction': pred,
-                        'result': result,
-                        'correct': result.get('prediction_correct', False),
-                        'factors': pred.get('factor_breakdown', {})
-                    })
-                    break
+            result = results_by_game.get(self._game_key(pred))
+            if result is not None:
+                matched.append(MatchedPrediction(
+                    prediction=pred,
+                    result=result,
+                    correct=result.get('prediction_correct', False),
+                    factors=pred.get('factor_breakdown', {})
+                ))
         
         return matched
     
-    def _predictions_match(self, prediction: Dict, result: Dict) -> bool:
-        """Check if prediction and result match."""
-        pred_home = prediction.get('home_team', '').upper()
-        pred_away = prediction.get('away_team', '').upper()
-        result_home = result.get('home_team', '').upper()
-        result_away = result.get('away_team', '').upper()
-        
-        return pred_home == result_home and pred_away == result_away
+    def _game_key(self, record: Dict) -> tuple:
+        """Build a case-insensitive (home, away) key for a prediction or result."""
+        return ((record.get('home_team') or '').upper(), (record.get('away_team') or '').upper())
     
-    def _analyze_factor_performance(self, matched_data: List[Dict]) -> Dict[str, Any]:
+    def _analyze_factor_performance(self, matched_data: List[MatchedPrediction]) -> Dict[str, Any]:
         """Analyze how each factor performed."""
-        factor_stats = {}
+        # One table per metric, keyed by factor, rather than a stats dict per factor
+        total_counts: Dict[str, int] = {}
+        correct_counts: Dict[str, int] = {}
+        correct_sums: Dict[str, float] = {}
+        incorrect_sums: Dict[str, float] = {}
+        magnitude_sums: Dict[str, float] = {}
         
         for match in matched_data:
-            factors = match.get('factors', {})
-            correct = match['correct']
+            correct = match.correct
             
-            for factor_name, factor_value in factors.items():
-                if factor_name not in factor_stats:
-                    factor_stats[factor_name] = {
-                        'correct_predictions': 0,
-                        'total_predictions': 0,
-                        'correct_factor_sum': 0.0,
-                        'incorrect_factor_sum': 0.0,
-                        'factor_values': []
-                    }
+            for factor_name, factor_value in match.factors.items():
+                if factor_name not in total_counts:
+                    total_counts[factor_name] = 0
+                    correct_counts[factor_name] = 0
+                    correct_sums[factor_name] = 0.0
+                    incorrect_sums[factor_name] = 0.0
+                    magnitude_sums[factor_name] = 0.0
                 
-                stats = factor_stats[factor_name]
-                stats['total_predictions'] += 1
-                stats['factor_values'].append(abs(factor_value))
+                magnitude = abs(factor_value)
+                total_counts[factor_name] += 1
+                magnitude_sums[factor_name] += magnitude
                 
                 if correct:
-                    stats['correct_predictions'] += 1
-                    stats['correct_factor_sum'] += abs(factor_value)
+                    correct_counts[factor_name] += 1
+                    correct_sums[factor_name] += magnitude
                 else:
-                    stats['incorrect_factor_sum'] += abs(factor_value)
+                    incorrect_sums[factor_name] += magnitude
         
         # Calculate performance metrics
         performance_metrics = {}
         
-        for factor_name, stats in factor_stats.items():
-            total = stats['total_predictions']
-            correct = stats['correct_predictions']
+        for factor_name, total in total_counts.items():
+            correct = correct_counts[factor_name]
             
             accuracy = correct / total if total > 0 else 0.5
             
             # Calculate predictive power (higher absolute values when correct)
-            avg_correct_value = stats['correct_factor_sum'] / max(correct, 1)
-            avg_incorrect_value = stats['incorrect_factor_sum'] / max(total - correct, 1)
+            avg_correct_value = correct_sums[factor_name] / max(correct, 1)
+            avg_incorrect_value = incorrect_sums[factor_name] / max(total - correct, 1)
             predictive_power = (avg_correct_value - avg_incorrect_value) / max(avg_correct_value + avg_incorrect_value, 1)
             
             performance_metrics[factor_name] = {
                 'accuracy': accuracy,
                 'predictive_power': predictive_power,
                 'sample_size': total,
-                'avg_factor_magnitude': statistics.mean(stats['factor_values']) if stats['factor_values'] else 0
+                'avg_factor_magnitude': magnitude_sums[factor_name] / total
             }
         
         return performance_metrics
@@ -416,20 +548,9 @@ class DynamicWeighter:
             
             # Calculate adjustment based on performance
             if sample_size >= self.min_samples_for_adjustment:
-                # Base adjustment on accuracy vs 50%
-                accuracy_adjustment = (accuracy - 0.5) * 2  # -1 to 1 range
-                
-                # Adjust based on predictive power
-                power_adjustment = predictive_power * 0.5
-                
-                # Combine adjustments
-                total_adjustment = (accuracy_adjustment + power_adjustment) * self.learning_rate
-                
-                # Apply to current weight
-                new_weight = current_weight * (1 + total_adjustment)
-                
-                # Ensure reasonable bounds
-                new_weight = max(0.01, min(0.5, new_weight))
+                new_weight = _adjusted_weight(
+                    current_weight, accuracy, predictive_power, self.learning_rate
+                )
                 
                 # Only include if change is significant
                 if abs(new_weight - current_weight) > current_weight * self.stability_threshold:
@@ -457,28 +578,22 @@ class DynamicWeighter:
         self.weight_state['base_weights'] = self._normalize_weights(
             self.weight_state['base_weights']
         )
+        self._invalidate_weight_caches()
+        self._dirty = True
     
     def _extract_conference(self, team_data: Dict) -> Optional[str]:
         """Extract conference from team data."""
         if not team_data:
             return None
         
-        conf_info = team_data.get('info', {}).get('conference', {})
-        conf_name = conf_info.get('name', '').upper()
-        
-        # Map to standard conference names
-        if 'SEC' in conf_name:
-            return 'SEC'
-        elif 'BIG TEN' in conf_name or 'BIG 10' in conf_name:
-            return 'BIG_TEN'
-        elif 'BIG 12' in conf_name:
-            return 'BIG_12'
-        elif 'ACC' in conf_name:
-            return 'ACC'
-        elif 'PAC' in conf_name:
-            return 'PAC_12'
-        else:
-            return 'OTHER'
+        # Team records from the data manager carry a flattened conference name;
+        # older cached records only have the nested form
+        conf_name = team_data.get('conference_name')
+        if conf_name is None:
+            conf_info = (team_data.get('info') or {}).get('conference') or {}
+            conf_name = conf_info.get('name') or ''
+        
+        return _classify_conference(conf_name)
     
     def get_weight_analysis_report(self) -> Dict[str, Any]:
         """Generate comprehensive weight analysis report."""
@@ -493,5 +608,21 @@ class DynamicWeighter:
         }
 
 
-# Global instance
-dynamic_weighter = DynamicWeighter()
\ No newline at end of file
+# Global instance, created on first use
+_dynamic_weighter = None
+
+def get_dynamic_weighter() -> DynamicWeighter:
+    """Get global dynamic weighter instance."""
+    global _dynamic_weighter
+    
+    if _dynamic_weighter is None:
+        _dynamic_weighter = DynamicWeighter()
+    
+    return _dynamic_weighter
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the module-level ``dynamic_weighter`` lazily."""
+    if name == 'dynamic_weighter':
+        return get_dynamic_weighter()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
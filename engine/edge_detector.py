@@ -3,10 +3,14 @@ Edge detector for College Football Market Edge Platform.
 Identifies and classifies contrarian betting opportunities.
 """
 
+import bisect
+import heapq
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
 from datetime import datetime
 from enum import Enum
+from operator import itemgetter
+from types import MappingProxyType
 
 from config import config
 
@@ -21,16 +25,143 @@ class EdgeType(Enum):
     INSUFFICIENT_DATA = "insufficient_data"
 
 
+# Small integer code per edge type so slate summaries can histogram into a list
+_EDGE_TYPE_CODES = {edge_type: code for code, edge_type in enumerate(EdgeType)}
+_EDGE_TYPE_VALUES = tuple(edge_type.value for edge_type in EdgeType)
+_EDGE_TYPE_NAMES = {edge_type: edge_type.name for edge_type in EdgeType}
+
+# Edge types that produce slate recommendations
+_ACTIONABLE_EDGES = frozenset({EdgeType.STRONG_CONTRARIAN, EdgeType.MODERATE_CONTRARIAN})
+
+# Edge type for each bucket of the ascending size cutoffs (minimal, slight, moderate, strong)
+_SIZE_BUCKETS = (
+    EdgeType.NO_EDGE,
+    EdgeType.CONSENSUS_PLAY,
+    EdgeType.SLIGHT_CONTRARIAN,
+    EdgeType.MODERATE_CONTRARIAN,
+    EdgeType.STRONG_CONTRARIAN
+)
+
+# Downgraded edge type by (confidence bucket, initial edge type); bucket 0 is
+# below low confidence, bucket 1 below medium. Missing pairs keep their type.
+_CONFIDENCE_DOWNGRADES = {
+    (0, EdgeType.STRONG_CONTRARIAN): EdgeType.SLIGHT_CONTRARIAN,
+    (0, EdgeType.MODERATE_CONTRARIAN): EdgeType.SLIGHT_CONTRARIAN,
+    (0, EdgeType.SLIGHT_CONTRARIAN): EdgeType.CONSENSUS_PLAY,
+    (1, EdgeType.STRONG_CONTRARIAN): EdgeType.MODERATE_CONTRARIAN
+}
+
+# Recommendation text
+_REC_INSUFFICIENT_DATA = "AVOID - Insufficient data for reliable prediction"
+_REC_LOW_CONFIDENCE = "AVOID - Confidence too low for recommended action"
+_REC_NEUTRAL = "NEUTRAL - No clear contrarian advantage identified"
+_REC_CONSENSUS = "CONSENSUS - Consider market consensus, minimal contrarian edge"
+_REC_PASS = "PASS - No meaningful contrarian opportunity"
+_TPL_STRONG_BUY = "STRONG BUY - {team} ({side}) - {edge:.1f} point edge with high confidence"
+_TPL_STRONG_MEDIUM = "BUY - {team} ({side}) - {edge:.1f} point edge with medium confidence"
+_TPL_BUY = "BUY - {team} ({side}) - {edge:.1f} point edge"
+_TPL_MODERATE_LEAN = "LEAN - {team} ({side}) - {edge:.1f} point edge, moderate confidence"
+_TPL_SLIGHT_LEAN = "LEAN - {team} ({side}) - {edge:.1f} point slight edge"
+
+
+def _format_explanation(edge_type: EdgeType, edge_size: float,
+                        confidence_score: float, confidence_level: str,
+                        category_adjustments: Optional[Dict[str, Optional[float]]],
+                        data_quality: float, vegas_spread: Optional[float],
+                        contrarian_spread: Optional[float]) -> str:
+    """Generate detailed explanation of the edge detection."""
+    
+    # Edge classification explanation
+    if edge_type == EdgeType.STRONG_CONTRARIAN:
+        edge_line = f"Strong contrarian opportunity identified with {edge_size:.1f} point edge."
+    elif edge_type == EdgeType.MODERATE_CONTRARIAN:
+        edge_line = f"Moderate contrarian opportunity with {edge_size:.1f} point edge."
+    elif edge_type == EdgeType.SLIGHT_CONTRARIAN:
+        edge_line = f"Slight contrarian edge of {edge_size:.1f} points detected."
+    elif edge_type == EdgeType.CONSENSUS_PLAY:
+        edge_line = f"Minimal edge ({edge_size:.1f} points) aligns mostly with market consensus."
+    elif edge_type == EdgeType.NO_EDGE:
+        edge_line = "No meaningful contrarian edge identified."
+    else:
+        edge_line = "Insufficient data quality for reliable edge detection."
+    
+    # Edge and confidence lines are always present, so format them together
+    explanation = f"{edge_line} Prediction confidence: {confidence_level} ({confidence_score:.1%})."
+    
+    # Key factors contributing to edge
+    if category_adjustments:
+        # Dominant category by magnitude, skipping None values
+        dominant_category, dominant_value, dominant_magnitude = None, 0.0, 0.0
+        for category, value in category_adjustments.items():
+            if value is None:
+                continue
+            magnitude = value if value >= 0 else -value
+            if magnitude > dominant_magnitude:
+                dominant_category, dominant_value, dominant_magnitude = category, value, magnitude
+        if dominant_magnitude > 0.1:
+            explanation += f" Primary driver: {dominant_category.replace('_', ' ')} factors ({dominant_value:+.2f} points)."
+    
+    # Data quality context
+    if data_quality < 0.5:
+        explanation += f" Note: Limited data quality ({data_quality:.1%}) affects prediction reliability."
+    
+    # Market context
+    if vegas_spread is not None and contrarian_spread is not None:
+        explanation += f" Vegas line: {vegas_spread:+.1f}, Contrarian prediction: {contrarian_spread:+.1f}."
+    elif vegas_spread is not None:
+        explanation += f" Vegas line: {vegas_spread:+.1f}, but contrarian prediction unavailable."
+    else:
+        explanation += " No betting line available for comparison."
+    
+    return explanation
+
+
 class EdgeClassification:
-    """Classification of a detected edge."""
+    """
+    Classification of a detected edge.
+    
+    The explanation is either given as text or formatted on first access
+    from the arguments captured at detection (explanation_args), then kept.
+    Only plain values are stored, so classifications pickle and copy
+    whether or not the explanation has been read. Equality and hashing
+    cover the classification, not the explanation.
+    """
+    
+    __slots__ = ('edge_type', 'edge_size', 'confidence', 'recommended_action',
+                 '_explanation', '_explanation_args')
     
     def __init__(self, edge_type: EdgeType, edge_size: float, confidence: float,
-                 explanation: str, recommended_action: str):
+                 explanation: Optional[str], recommended_action: str,
+                 explanation_args: Optional[Tuple] = None):
         self.edge_type = edge_type
         self.edge_size = edge_size
         self.confidence = confidence
-        self.explanation = explanation
         self.recommended_action = recommended_action
+        self._explanation = explanation
+        self._explanation_args = explanation_args
+    
+    @property
+    def explanation(self) -> str:
+        """Explanation text, formatted on first access when not given as text."""
+        if self._explanation is None and self._explanation_args is not None:
+            self._explanation = _format_explanation(*self._explanation_args)
+            self._explanation_args = None
+        return self._explanation
+    
+    def _key(self) -> Tuple:
+        return (self.edge_type, self.edge_size, self.confidence, self.recommended_action)
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+    
+    def __hash__(self) -> int:
+        return hash(self._key())
+    
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(edge_type={self.edge_type!r}, edge_size={self.edge_size!r}, "
+                f"confidence={self.confidence!r}, recommended_action={self.recommended_action!r})")
 
 
 class EdgeDetector:
@@ -41,29 +172,53 @@ class EdgeDetector:
     our contrarian analysis suggests a meaningful edge over market consensus.
     """
     
+    __slots__ = (
+        'edge_thresholds', 'confidence_thresholds', 'risk_parameters', 'logger',
+        '_strong_edge', '_moderate_edge', '_slight_edge', '_minimal_edge',
+        '_high_confidence', '_medium_confidence', '_low_confidence',
+        '_max_recommended_edge', '_min_confidence_for_action', '_data_quality_threshold',
+        '_size_cutoffs'
+    )
+    
     def __init__(self):
         """Initialize edge detector."""
+        # Configuration is read-only: classification reads the scalar copies
+        # below, so edits to these mappings could never take effect
+        
         # Edge detection thresholds
-        self.edge_thresholds = {
+        self.edge_thresholds = MappingProxyType({
             'strong_contrarian': 3.0,      # 3+ point edge
             'moderate_contrarian': 2.0,    # 2-3 point edge
             'slight_contrarian': 1.0,      # 1-2 point edge
             'minimal_edge': 0.5            # 0.5-1 point edge
-        }
+        })
         
         # Confidence thresholds for recommendations
-        self.confidence_thresholds = {
+        self.confidence_thresholds = MappingProxyType({
             'high_confidence': 0.75,
             'medium_confidence': 0.60,
             'low_confidence': 0.45
-        }
+        })
         
         # Risk management parameters
-        self.risk_parameters = {
+        self.risk_parameters = MappingProxyType({
             'max_recommended_edge': 5.0,   # Don't recommend edges > 5 points (likely data error)
             'min_confidence_for_action': 0.40,  # Minimum confidence to recommend action
             'data_quality_threshold': 0.30      # Minimum data quality for recommendations
-        }
+        })
+        
+        # Scalar copies of the thresholds for the per-game hot path
+        self._strong_edge = self.edge_thresholds['strong_contrarian']
+        self._moderate_edge = self.edge_thresholds['moderate_contrarian']
+        self._slight_edge = self.edge_thresholds['slight_contrarian']
+        self._minimal_edge = self.edge_thresholds['minimal_edge']
+        self._high_confidence = self.confidence_thresholds['high_confidence']
+        self._medium_confidence = self.confidence_thresholds['medium_confidence']
+        self._low_confidence = self.confidence_thresholds['low_confidence']
+        self._max_recommended_edge = self.risk_parameters['max_recommended_edge']
+        self._min_confidence_for_action = self.risk_parameters['min_confidence_for_action']
+        self._data_quality_threshold = self.risk_parameters['data_quality_threshold']
+        self._size_cutoffs = (self._minimal_edge, self._slight_edge, self._moderate_edge, self._strong_edge)
         
         # Logging
         self.logger = logging.getLogger(__name__)
@@ -99,57 +254,109 @@ class EdgeDetector:
             confidence_score = 0.0
         data_quality = context.get('data_quality', 0.0)
         
-        # Perform edge detection
-        edge_classification = self._classify_edge_size(edge_size)
-        
-        # Validate edge with risk management checks
-        validated_edge = self._validate_edge(
-            edge_classification, edge_size, confidence_score, 
+        # Missing lines or poor data always end as INSUFFICIENT_DATA, so skip
+        # classification and validation for those games
+        if vegas_spread is None or contrarian_spread is None or data_quality < self._data_quality_threshold:
+            validated_edge = EdgeType.INSUFFICIENT_DATA
+            recommendation = _REC_INSUFFICIENT_DATA
+        else:
+            # Perform edge detection
+            abs_edge_size = abs(edge_size)
+            edge_classification = self._classify_edge_size(abs_edge_size)
+            
+            # Validate edge with risk management checks
+            validated_edge = self._validate_edge(
+                edge_classification, abs_edge_size, confidence_score, 
+                data_quality, vegas_spread, contrarian_spread
+            )
+            
+            # Generate recommendation
+            recommendation = self._generate_recommendation(
+                validated_edge, edge_size, confidence_score,
+                prediction_result.get('edge_direction', 'neutral'),
+                prediction_result.get('home_team', 'Home'),
+                prediction_result.get('away_team', 'Away')
+            )
+        
+        # Defer the detailed explanation until it is read; most games on a
+        # slate are never displayed. Adjustments are copied so later changes
+        # to the prediction result do not leak into the text.
+        category_adjustments = prediction_result.get('category_adjustments')
+        explanation_args = (
+            validated_edge, edge_size, confidence_score,
+            confidence_assessment.get('confidence_level', 'Unknown'),
+            dict(category_adjustments) if category_adjustments else None,
             data_quality, vegas_spread, contrarian_spread
         )
         
-        # Generate recommendation
-        recommendation = self._generate_recommendation(
-            validated_edge, edge_size, confidence_score, 
-            prediction_result, confidence_assessment
-        )
-        
-        # Create detailed explanation
-        explanation = self._generate_explanation(
-            validated_edge, edge_size, confidence_score, 
-            prediction_result, confidence_assessment, context
-        )
-        
-        self.logger.debug(f"Edge detected: {validated_edge.name} ({edge_size:.2f} points, {confidence_score:.1%} confidence)")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Edge detected: {_EDGE_TYPE_NAMES[validated_edge]} ({edge_size:.2f} points, {confidence_score:.1%} confidence)")
         
         return EdgeClassification(
             edge_type=validated_edge,
             edge_size=edge_size,
             confidence=confidence_score,
-            explanation=explanation,
-            recommended_action=recommendation
+            explanation=None,
+            recommended_action=recommendation,
+            explanation_args=explanation_args
         )
     
-    def _classify_edge_size(self, edge_size: float) -> EdgeType:
-        """Classify edge based on size thresholds."""
+    def classify_batch(self, edge_sizes: Iterable[Optional[float]],
+                       confidence_scores: Iterable[Optional[float]],
+                       data_qualities: Iterable[float],
+                       vegas_spreads: Iterable[Optional[float]],
+                       contrarian_spreads: Iterable[Optional[float]]) -> List[EdgeType]:
+        """
+        Classify edges for many games from parallel columns.
+        
+        Applies the same classification and validation as detect_edge but
+        skips recommendation and explanation text, for backtests that only
+        need the edge type of each game.
+        
+        Args:
+            edge_sizes: Edge size per game
+            confidence_scores: Confidence score per game
+            data_qualities: Data quality per game
+            vegas_spreads: Vegas spread per game
+            contrarian_spreads: Contrarian spread per game
+            
+        Returns:
+            EdgeType per game, in input order
+        """
+        classify = self._classify_edge_size
+        validate = self._validate_edge
+        min_data_quality = self._data_quality_threshold
+        insufficient = EdgeType.INSUFFICIENT_DATA
+        
+        edge_types = []
+        for edge_size, confidence_score, data_quality, vegas_spread, contrarian_spread in zip(
+                edge_sizes, confidence_scores, data_qualities, vegas_spreads, contrarian_spreads):
+            if vegas_spread is None or contrarian_spread is None or data_quality < min_data_quality:
+                edge_types.append(insufficient)
+                continue
+            abs_edge_size = abs(edge_size) if edge_size is not None else 0.0
+            if confidence_score is None:
+                confidence_score = 0.0
+            edge_types.append(validate(
+                classify(abs_edge_size), abs_edge_size, confidence_score,
+                data_quality, vegas_spread, contrarian_spread
+            ))
+        
+        return edge_types
+    
+    def _classify_edge_size(self, abs_edge_size: float) -> EdgeType:
+        """Classify edge based on size thresholds (expects the absolute edge size)."""
         # Handle None or invalid edge size
-        if edge_size is None or not isinstance(edge_size, (int, float)):
+        if abs_edge_size is None or not isinstance(abs_edge_size, (int, float)):
             return EdgeType.INSUFFICIENT_DATA
-            
-        edge_size = abs(edge_size)  # Use absolute value for classification
-        
-        if edge_size >= self.edge_thresholds['strong_contrarian']:
-            return EdgeType.STRONG_CONTRARIAN
-        elif edge_size >= self.edge_thresholds['moderate_contrarian']:
-            return EdgeType.MODERATE_CONTRARIAN
-        elif edge_size >= self.edge_thresholds['slight_contrarian']:
-            return EdgeType.SLIGHT_CONTRARIAN
-        elif edge_size >= self.edge_thresholds['minimal_edge']:
-            return EdgeType.CONSENSUS_PLAY
-        else:
+        
+        # Negated comparison also sends NaN to NO_EDGE
+        if not abs_edge_size >= self._minimal_edge:
             return EdgeType.NO_EDGE
+        
+        return _SIZE_BUCKETS[bisect.bisect_right(self._size_cutoffs, abs_edge_size)]
     
-    def _validate_edge(self, initial_classification: EdgeType, edge_size: float,
+    def _validate_edge(self, initial_classification: EdgeType, abs_edge_size: float,
                       confidence_score: float, data_quality: float,
                       vegas_spread: Optional[float], contrarian_spread: Optional[float]) -> EdgeType:
         """Validate edge classification with risk management checks."""
@@ -158,41 +365,35 @@ class EdgeDetector:
         if vegas_spread is None or contrarian_spread is None:
             return EdgeType.INSUFFICIENT_DATA
         
-        if data_quality < self.risk_parameters['data_quality_threshold']:
+        if data_quality < self._data_quality_threshold:
             return EdgeType.INSUFFICIENT_DATA
         
         # Check for suspiciously large edges (likely data errors)
-        if edge_size > self.risk_parameters['max_recommended_edge']:
-            self.logger.warning(f"Suspiciously large edge detected: {edge_size:.2f} points")
+        if abs_edge_size > self._max_recommended_edge:
+            self.logger.warning(f"Suspiciously large edge detected: {abs_edge_size:.2f} points")
             return EdgeType.INSUFFICIENT_DATA
         
         # Downgrade edge classification based on confidence
-        if confidence_score < self.confidence_thresholds['low_confidence']:
-            if initial_classification in [EdgeType.STRONG_CONTRARIAN, EdgeType.MODERATE_CONTRARIAN]:
-                return EdgeType.SLIGHT_CONTRARIAN
-            elif initial_classification == EdgeType.SLIGHT_CONTRARIAN:
-                return EdgeType.CONSENSUS_PLAY
-        
-        elif confidence_score < self.confidence_thresholds['medium_confidence']:
-            if initial_classification == EdgeType.STRONG_CONTRARIAN:
-                return EdgeType.MODERATE_CONTRARIAN
+        if confidence_score < self._low_confidence:
+            confidence_bucket = 0
+        elif confidence_score < self._medium_confidence:
+            confidence_bucket = 1
+        else:
+            return initial_classification
         
-        return initial_classification
+        return _CONFIDENCE_DOWNGRADES.get((confidence_bucket, initial_classification),
+                                          initial_classification)
     
     def _generate_recommendation(self, edge_type: EdgeType, edge_size: float,
-                               confidence_score: float, prediction_result: Dict[str, Any],
-                               confidence_assessment: Dict[str, Any]) -> str:
+                               confidence_score: float, edge_direction: str,
+                               home_team: str, away_team: str) -> str:
         """Generate betting recommendation based on edge classification."""
         
         if edge_type == EdgeType.INSUFFICIENT_DATA:
-            return "AVOID - Insufficient data for reliable prediction"
-        
-        if confidence_score < self.risk_parameters['min_confidence_for_action']:
-            return "AVOID - Confidence too low for recommended action"
+            return _REC_INSUFFICIENT_DATA
         
-        edge_direction = prediction_result.get('edge_direction', 'neutral')
-        home_team = prediction_result.get('home_team', 'Home')
-        away_team = prediction_result.get('away_team', 'Away')
+        if confidence_score < self._min_confidence_for_action:
+            return _REC_LOW_CONFIDENCE
         
         # Determine favored team
         if edge_direction == 'home':
@@ -202,81 +403,31 @@ class EdgeDetector:
             favored_team = away_team
             side = "away"
         else:
-            return "NEUTRAL - No clear contrarian advantage identified"
+            return _REC_NEUTRAL
         
         # Generate recommendation based on edge strength
         if edge_type == EdgeType.STRONG_CONTRARIAN:
-            if confidence_score >= self.confidence_thresholds['high_confidence']:
-                return f"STRONG BUY - {favored_team} ({side}) - {edge_size:.1f} point edge with high confidence"
+            if confidence_score >= self._high_confidence:
+                template = _TPL_STRONG_BUY
             else:
-                return f"BUY - {favored_team} ({side}) - {edge_size:.1f} point edge with medium confidence"
+                template = _TPL_STRONG_MEDIUM
         
         elif edge_type == EdgeType.MODERATE_CONTRARIAN:
-            if confidence_score >= self.confidence_thresholds['medium_confidence']:
-                return f"BUY - {favored_team} ({side}) - {edge_size:.1f} point edge"
+            if confidence_score >= self._medium_confidence:
+                template = _TPL_BUY
             else:
-                return f"LEAN - {favored_team} ({side}) - {edge_size:.1f} point edge, moderate confidence"
+                template = _TPL_MODERATE_LEAN
         
         elif edge_type == EdgeType.SLIGHT_CONTRARIAN:
-            return f"LEAN - {favored_team} ({side}) - {edge_size:.1f} point slight edge"
-        
-        elif edge_type == EdgeType.CONSENSUS_PLAY:
-            return "CONSENSUS - Consider market consensus, minimal contrarian edge"
-        
-        else:
-            return "PASS - No meaningful contrarian opportunity"
-    
-    def _generate_explanation(self, edge_type: EdgeType, edge_size: float,
-                            confidence_score: float, prediction_result: Dict[str, Any],
-                            confidence_assessment: Dict[str, Any], context: Dict[str, Any]) -> str:
-        """Generate detailed explanation of the edge detection."""
-        
-        explanation_parts = []
+            template = _TPL_SLIGHT_LEAN
         
-        # Edge classification explanation
-        if edge_type == EdgeType.STRONG_CONTRARIAN:
-            explanation_parts.append(f"Strong contrarian opportunity identified with {edge_size:.1f} point edge.")
-        elif edge_type == EdgeType.MODERATE_CONTRARIAN:
-            explanation_parts.append(f"Moderate contrarian opportunity with {edge_size:.1f} point edge.")
-        elif edge_type == EdgeType.SLIGHT_CONTRARIAN:
-            explanation_parts.append(f"Slight contrarian edge of {edge_size:.1f} points detected.")
         elif edge_type == EdgeType.CONSENSUS_PLAY:
-            explanation_parts.append(f"Minimal edge ({edge_size:.1f} points) aligns mostly with market consensus.")
-        elif edge_type == EdgeType.NO_EDGE:
-            explanation_parts.append("No meaningful contrarian edge identified.")
-        else:
-            explanation_parts.append("Insufficient data quality for reliable edge detection.")
-        
-        # Confidence explanation
-        confidence_level = confidence_assessment.get('confidence_level', 'Unknown')
-        explanation_parts.append(f"Prediction confidence: {confidence_level} ({confidence_score:.1%}).")
-        
-        # Key factors contributing to edge
-        category_adjustments = prediction_result.get('category_adjustments', {})
-        if category_adjustments:
-            # Filter out None values and get dominant category
-            valid_adjustments = {k: v for k, v in category_adjustments.items() if v is not None}
-            if valid_adjustments:
-                dominant_category = max(valid_adjustments.items(), key=lambda x: abs(x[1]))
-                if abs(dominant_category[1]) > 0.1:
-                    explanation_parts.append(f"Primary driver: {dominant_category[0].replace('_', ' ')} factors ({dominant_category[1]:+.2f} points).")
-        
-        # Data quality context
-        data_quality = context.get('data_quality', 0.0)
-        if data_quality < 0.5:
-            explanation_parts.append(f"Note: Limited data quality ({data_quality:.1%}) affects prediction reliability.")
+            return _REC_CONSENSUS
         
-        # Market context
-        vegas_spread = prediction_result.get('vegas_spread')
-        contrarian_spread = prediction_result.get('contrarian_spread')
-        if vegas_spread is not None and contrarian_spread is not None:
-            explanation_parts.append(f"Vegas line: {vegas_spread:+.1f}, Contrarian prediction: {contrarian_spread:+.1f}.")
-        elif vegas_spread is not None:
-            explanation_parts.append(f"Vegas line: {vegas_spread:+.1f}, but contrarian prediction unavailable.")
         else:
-            explanation_parts.append("No betting line available for comparison.")
+            return _REC_PASS
         
-        return " ".join(explanation_parts)
+        return template.format(team=favored_team, side=side, edge=edge_size)
     
     def analyze_edge_opportunities(self, prediction_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -288,7 +439,39 @@ class EdgeDetector:
         Returns:
             Summary analysis of edge opportunities
         """
-        if not prediction_results:
+        classifications = [result.get('edge_classification') for result in prediction_results]
+        
+        return self.analyze_edge_opportunities_columns(
+            [c.edge_type if c else None for c in classifications],
+            [c.edge_size if c else None for c in classifications],
+            [c.confidence if c else None for c in classifications],
+            [result.get('home_team', '') for result in prediction_results],
+            [result.get('away_team', '') for result in prediction_results],
+            [c.recommended_action if c else None for c in classifications]
+        )
+    
+    def analyze_edge_opportunities_columns(self, edge_types: Sequence[Optional[EdgeType]],
+                                           edge_sizes: Sequence[Optional[float]],
+                                           confidences: Sequence[Optional[float]],
+                                           home_teams: Sequence[str],
+                                           away_teams: Sequence[str],
+                                           recommended_actions: Sequence[Optional[str]]) -> Dict[str, Any]:
+        """
+        Analyze a slate given as parallel columns, one entry per game.
+        
+        Args:
+            edge_types: Edge type per game, None for games without a classification
+            edge_sizes: Edge size per game
+            confidences: Confidence per game
+            home_teams: Home team per game
+            away_teams: Away team per game
+            recommended_actions: Recommended action per game
+            
+        Returns:
+            Summary analysis of edge opportunities
+        """
+        total_games = len(edge_types)
+        if not total_games:
             return {
                 'total_games': 0,
                 'edge_opportunities': 0,
@@ -298,34 +481,40 @@ class EdgeDetector:
                 'recommendations': []
             }
         
-        # Categorize edges
-        edge_counts = {edge_type: 0 for edge_type in EdgeType}
-        recommendations = []
-        
-        for result in prediction_results:
-            edge_classification = result.get('edge_classification')
-            if edge_classification:
-                edge_counts[edge_classification.edge_type] += 1
-                
-                # Collect actionable recommendations
-                if edge_classification.edge_type in [EdgeType.STRONG_CONTRARIAN, EdgeType.MODERATE_CONTRARIAN]:
-                    recommendations.append({
-                        'game': f"{result.get('away_team', '')} @ {result.get('home_team', '')}",
-                        'edge_type': edge_classification.edge_type.value,
-                        'edge_size': edge_classification.edge_size,
-                        'confidence': edge_classification.confidence,
-                        'recommendation': edge_classification.recommended_action
-                    })
-        
-        # Sort recommendations by edge size and confidence
-        recommendations.sort(key=lambda x: (x['edge_size'], x['confidence']), reverse=True)
+        # Single pass: histogram edge types by code and keep only the
+        # actionable candidates; recommendation dicts are built for the top 5
+        edge_codes = _EDGE_TYPE_CODES
+        code_counts = [0] * len(edge_codes)
+        candidates = []
+        
+        for index, edge_type in enumerate(edge_types):
+            if edge_type is None:
+                continue
+            code_counts[edge_codes[edge_type]] += 1
+            
+            if edge_type in _ACTIONABLE_EDGES:
+                candidates.append((edge_sizes[index], confidences[index], index))
+        
+        # Rank by edge size and confidence (nlargest is stable like a reverse sort)
+        top_candidates = heapq.nlargest(5, candidates, key=itemgetter(0, 1))
+        recommendations = [
+            {
+                'game': f"{away_teams[index]} @ {home_teams[index]}",
+                'edge_type': edge_types[index].value,
+                'edge_size': edge_size,
+                'confidence': confidence,
+                'recommendation': recommended_actions[index]
+            }
+            for edge_size, confidence, index in top_candidates
+        ]
+        edge_counts = {edge_type: code_counts[code] for edge_type, code in edge_codes.items()}
         
         total_edges = (edge_counts[EdgeType.STRONG_CONTRARIAN] + 
                       edge_counts[EdgeType.MODERATE_CONTRARIAN] + 
                       edge_counts[EdgeType.SLIGHT_CONTRARIAN])
         
         return {
-            'total_games': len(prediction_results),
+            'total_games': total_games,
             'edge_opportunities': total_edges,
             'strong_edges': edge_counts[EdgeType.STRONG_CONTRARIAN],
             'moderate_edges': edge_counts[EdgeType.MODERATE_CONTRARIAN],
@@ -333,17 +522,17 @@ class EdgeDetector:
             'consensus_plays': edge_counts[EdgeType.CONSENSUS_PLAY],
             'no_edge_games': edge_counts[EdgeType.NO_EDGE],
             'insufficient_data': edge_counts[EdgeType.INSUFFICIENT_DATA],
-            'recommendations': recommendations[:5],  # Top 5 recommendations
-            'edge_rate': total_edges / len(prediction_results) if prediction_results else 0
+            'recommendations': recommendations,  # Top 5 recommendations
+            'edge_rate': total_edges / total_games
         }
     
     def get_edge_detection_stats(self) -> Dict[str, Any]:
-        """Get edge detection configuration and statistics."""
+        """Get edge detection configuration and statistics as plain, JSON-friendly data."""
         return {
-            'edge_thresholds': self.edge_thresholds,
-            'confidence_thresholds': self.confidence_thresholds,
-            'risk_parameters': self.risk_parameters,
-            'edge_types': [edge_type.value for edge_type in EdgeType]
+            'edge_thresholds': dict(self.edge_thresholds),
+            'confidence_thresholds': dict(self.confidence_thresholds),
+            'risk_parameters': dict(self.risk_parameters),
+            'edge_types': list(_EDGE_TYPE_VALUES)
         }
 
 
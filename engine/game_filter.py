@@ -3,14 +3,155 @@ Game Quality Filter for College Football Market Edge Platform.
 Filters out high-variance and low-quality betting opportunities.
 """
 
+import concurrent.futures
+import functools
 import logging
-from typing import Dict, Any, List, Optional, Set
+import re
+from collections import defaultdict
+from collections.abc import Mapping
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional, Sequence, Set, Tuple
 from datetime import datetime
+from operator import attrgetter
+from types import MappingProxyType
 
 from config import config
 from utils.normalizer import normalizer
 
 
+@functools.lru_cache(maxsize=4096)
+def _norm_upper(team_name: str) -> str:
+    """Normalized uppercase team name, or the raw name uppercased if the normalizer has no match."""
+    # The normalizer only knows FBS teams
+    return (normalizer.normalize(team_name) or team_name).upper()
+
+
+class RatedGame(Mapping):
+    """
+    A recommended game with its quality assessment attached.
+    
+    Wraps the caller's game dict instead of copying it. It is a read-only
+    mapping over the game's keys plus 'quality_assessment', like the copied
+    dicts were; use to_dict() for a plain dict (e.g. for JSON).
+    """
+    
+    __slots__ = ('game', 'assessment', 'score')
+    
+    def __init__(self, game: Dict[str, Any], assessment: Dict[str, Any]):
+        self.game = game
+        self.assessment = assessment
+        self.score = assessment['quality_score']
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == 'quality_assessment':
+            return self.assessment
+        return self.game[key]
+    
+    def __contains__(self, key: object) -> bool:
+        return key == 'quality_assessment' or key in self.game
+    
+    def __iter__(self) -> Iterator[str]:
+        for key in self.game:
+            if key != 'quality_assessment':
+                yield key
+        yield 'quality_assessment'
+    
+    def __len__(self) -> int:
+        return len(self.game) + ('quality_assessment' not in self.game)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style get over the game and its quality assessment."""
+        if key == 'quality_assessment':
+            return self.assessment
+        return self.game.get(key, default)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy of the game with its quality assessment."""
+        return {**self.game, 'quality_assessment': self.assessment}
+
+
+# Overall quality by minimum score, best first: (min score, quality, recommendation)
+_QUALITY_LEVELS = (
+    (0.8, 'PREMIUM', 'HIGH_CONFIDENCE_ANALYSIS'),
+    (0.6, 'GOOD', 'STANDARD_ANALYSIS'),
+    (0.4, 'FAIR', 'REDUCED_CONFIDENCE'),
+    (float('-inf'), 'POOR', 'SKIP_ANALYSIS')
+)
+
+# Sort key for rated games (C-level attribute lookup instead of a lambda)
+_BY_SCORE = attrgetter('score')
+
+
+def _compile_keywords(keywords: FrozenSet[str]) -> 're.Pattern[str]':
+    """Compile keywords into one alternation matching any of them as a substring."""
+    return re.compile('|'.join(re.escape(keyword) for keyword in sorted(keywords)))
+
+
+# Filter thresholds (read-only; shared by every GameQualityFilter)
+_FILTER_CRITERIA = MappingProxyType({
+    'max_spread': 30.0,          # Avoid spreads > 30 points
+    'min_spread': 0.5,           # Avoid pick'em games < 0.5
+    'min_data_quality': 0.6,     # Require 60% data completeness
+    'max_weather_impact': 20,    # Wind speed in mph
+    'required_tv_coverage': False # Don't require TV but prefer it
+})
+
+# FCS schools (partial list - would be comprehensive in production)
+_FCS_SCHOOLS = frozenset({
+    'CHATTANOOGA', 'FURMAN', 'WOFFORD', 'CITADEL', 'VMI',
+    'JACKSON STATE', 'FLORIDA A&M', 'BETHUNE-COOKMAN',
+    'NORTH DAKOTA STATE', 'SOUTH DAKOTA STATE', 'MONTANA',
+    'JAMES MADISON', 'DELAWARE', 'NEW HAMPSHIRE', 'MAINE',
+    'FORDHAM', 'COLGATE', 'HOLY CROSS', 'BUCKNELL',
+    'RICHMOND', 'WILLIAM & MARY', 'VILLANOVA', 'RHODE ISLAND'
+})
+
+# Power conferences for quality classification. Names are matched as
+# substrings, so a long form is only listed when it does not already
+# contain a short one (e.g. 'BIG TEN CONFERENCE' is covered by 'BIG TEN').
+_POWER_CONFERENCES = frozenset({
+    'SEC', 'BIG TEN', 'BIG 12', 'ACC', 'PAC-12',
+    'SOUTHEASTERN CONFERENCE', 'ATLANTIC COAST CONFERENCE'
+})
+
+# Group of 5 conferences ('AMERICAN' also covers the American Athletic
+# and Mid-American long forms)
+_GROUP_OF_5 = frozenset({
+    'AMERICAN', 'AAC', 'MOUNTAIN WEST', 'MAC', 'SUN BELT', 'CONFERENCE USA'
+})
+
+# One compiled alternation per keyword set for the "name contains keyword" checks
+_FCS_PATTERN = _compile_keywords(_FCS_SCHOOLS)
+_POWER_PATTERN = _compile_keywords(_POWER_CONFERENCES)
+_GROUP_OF_5_PATTERN = _compile_keywords(_GROUP_OF_5)
+
+# Weight of each filter in the overall quality score
+_QUALITY_WEIGHTS = (
+    ('spread', 0.25),
+    ('opponents', 0.25),
+    ('data', 0.20),
+    ('conference', 0.15),
+    ('timing', 0.10),
+    ('weather', 0.05)
+)
+
+
+def _index_rivalries(pairs: Tuple[Tuple[str, str], ...]) -> Mapping[str, FrozenSet[str]]:
+    """Index rivalry pairs by team, in both directions."""
+    rivals: Dict[str, Set[str]] = defaultdict(set)
+    for team1, team2 in pairs:
+        rivals[team1].add(team2)
+        rivals[team2].add(team1)
+    return MappingProxyType({team: frozenset(opponents) for team, opponents in rivals.items()})
+
+
+# Rivalry pairs indexed by team (partial list - would need comprehensive rivalry database)
+_RIVALRIES = _index_rivalries((
+    ('ALABAMA', 'AUBURN'), ('OHIO STATE', 'MICHIGAN'),
+    ('TEXAS', 'OKLAHOMA'), ('USC', 'UCLA'),
+    ('FLORIDA', 'GEORGIA'), ('CLEMSON', 'SOUTH CAROLINA')
+))
+
+
 class GameQualityFilter:
     """
     Filters games based on quality and predictability criteria.
@@ -25,44 +166,48 @@ class GameQualityFilter:
     - Injury/suspension alerts
     """
     
+    # Base filter results, copied per game; empty issue/factor lists are shared tuples
+    _SPREAD_BASE = {'quality': 'GOOD', 'score': 1.0, 'issues': ()}
+    _OPPONENT_BASE = {'quality': 'GOOD', 'score': 1.0, 'classification': 'P5_VS_P5', 'issues': ()}
+    _FCS_OPPONENT_RESULT = {'quality': 'POOR', 'score': 0.3, 'classification': 'FCS_GAME', 'issues': ('FCS_OPPONENT',)}
+    _DATA_BASE = {'quality': 'GOOD', 'score': 1.0, 'completeness': 0.0, 'missing_data': ()}
+    _CONFERENCE_BASE = {'quality': 'GOOD', 'score': 1.0, 'significance': 'CONFERENCE', 'factors': ()}
+    _TIMING_BASE = {'quality': 'GOOD', 'score': 1.0, 'factors': ()}
+    _WEATHER_BASE = {'quality': 'GOOD', 'score': 1.0, 'impact': 'MINIMAL', 'factors': ()}
+    
+    # Games per worker task when evaluating a slate in parallel
+    _PARALLEL_CHUNK_SIZE = 32
+    
+    # Fields counted for data completeness
+    _ESSENTIAL_FIELDS = ('home_team', 'away_team', 'vegas_spread', 'week')
+    _OPTIONAL_FIELDS = ('home_team_data', 'away_team_data', 'weather', 'tv_coverage')
+    
+    # One presence bit per field, essential fields in the low bits
+    _DATA_FIELDS = _ESSENTIAL_FIELDS + _OPTIONAL_FIELDS
+    _ESSENTIAL_MASK = (1 << len(_ESSENTIAL_FIELDS)) - 1
+    
     def __init__(self):
         """Initialize game quality filter."""
         self.logger = logging.getLogger(__name__)
         
-        # Filter thresholds
-        self.filter_criteria = {
-            'max_spread': 30.0,          # Avoid spreads > 30 points
-            'min_spread': 0.5,           # Avoid pick'em games < 0.5
-            'min_data_quality': 0.6,     # Require 60% data completeness
-            'max_weather_impact': 20,    # Wind speed in mph
-            'required_tv_coverage': False # Don't require TV but prefer it
-        }
-        
-        # FCS schools (partial list - would be comprehensive in production)
-        self.fcs_schools = {
-            'CHATTANOOGA', 'FURMAN', 'WOFFORD', 'CITADEL', 'VMI',
-            'JACKSON STATE', 'FLORIDA A&M', 'BETHUNE-COOKMAN',
-            'NORTH DAKOTA STATE', 'SOUTH DAKOTA STATE', 'MONTANA',
-            'JAMES MADISON', 'DELAWARE', 'NEW HAMPSHIRE', 'MAINE',
-            'FORDHAM', 'COLGATE', 'HOLY CROSS', 'BUCKNELL',
-            'RICHMOND', 'WILLIAM & MARY', 'VILLANOVA', 'RHODE ISLAND'
-        }
-        
-        # Power conferences for quality classification
-        self.power_conferences = {
-            'SEC', 'BIG TEN', 'BIG 12', 'ACC', 'PAC-12', 
-            'BIG TEN CONFERENCE', 'SOUTHEASTERN CONFERENCE',
-            'ATLANTIC COAST CONFERENCE', 'PAC-12 CONFERENCE'
-        }
-        
-        # Group of 5 conferences
-        self.group_of_5 = {
-            'AMERICAN', 'AAC', 'MOUNTAIN WEST', 'MAC', 'SUN BELT', 'CONFERENCE USA',
-            'AMERICAN ATHLETIC CONFERENCE', 'MID-AMERICAN CONFERENCE'
-        }
+        # Shared module-level configuration; nothing here is rebuilt per instance
+        self.filter_criteria = _FILTER_CRITERIA
+        self.fcs_schools = _FCS_SCHOOLS
+        self.power_conferences = _POWER_CONFERENCES
+        self.group_of_5 = _GROUP_OF_5
+        self._fcs_pattern = _FCS_PATTERN
+        self._power_pattern = _POWER_PATTERN
+        self._group_of_5_pattern = _GROUP_OF_5_PATTERN
+        self.quality_weights = _QUALITY_WEIGHTS
+        self._rivalries = _RIVALRIES
         
         self.logger.info("Game Quality Filter initialized")
     
+    def __reduce__(self):
+        # The configuration is module-level (and MappingProxyType does not pickle),
+        # so worker processes just build their own instance bound to it
+        return (self.__class__, ())
+    
     def evaluate_game_quality(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Comprehensive game quality evaluation.
@@ -73,60 +218,90 @@ class GameQualityFilter:
         Returns:
             Quality assessment with recommendations
         """
-        try:
-            quality_assessment = {
-                'overall_quality': 'UNKNOWN',
-                'quality_score': 0.0,
-                'filter_results': {},
-                'recommendations': [],
-                'warnings': [],
-                'should_analyze': True
-            }
-            
-            # Run all quality filters
-            spread_filter = self._evaluate_spread_quality(game_data)
-            quality_assessment['filter_results']['spread'] = spread_filter
-            
-            opponent_filter = self._evaluate_opponent_quality(game_data)
-            quality_assessment['filter_results']['opponents'] = opponent_filter
-            
-            data_filter = self._evaluate_data_quality(game_data)
-            quality_assessment['filter_results']['data'] = data_filter
+        return self.evaluate_games_batch([game_data])[0]
+    
+    def evaluate_games_batch(self, games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate quality for a slate of games in one pass.
+        
+        Team-level lookups (FCS status) are made once per distinct team in
+        the slate instead of once per game.
+        
+        Args:
+            games: List of complete game information
             
-            conference_filter = self._evaluate_conference_quality(game_data)
-            quality_assessment['filter_results']['conference'] = conference_filter
+        Returns:
+            Quality assessments in the same order as games
+        """
+        fcs_status: Dict[str, bool] = {}
+        return [self._assess_game(game_data, fcs_status) for game_data in games]
+    
+    @staticmethod
+    def _copy_filter_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached filter result, including its issue/factor lists."""
+        return {key: list(value) if isinstance(value, list) else value
+                for key, value in result.items()}
+    
+    def _assess_game(self, game_data: Dict[str, Any], fcs_status: Dict[str, bool],
+                     static_results: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Run all quality filters for one game, sharing FCS lookups across the slate.
+        
+        If static_results is given, it caches the results of the filters that
+        do not depend on the spread, so rescoring a game only reruns the spread
+        and data filters.
+        """
+        try:
+            # Games that can never qualify skip the full set of filters
+            rejection = self._quick_reject_reason(game_data, fcs_status)
+            if rejection:
+                return {
+                    'overall_quality': 'POOR',
+                    'quality_score': 0.0,
+                    'filter_results': {},
+                    'recommendations': ['SKIP_ANALYSIS'],
+                    'warnings': [rejection],
+                    'should_analyze': False
+                }
             
-            timing_filter = self._evaluate_timing_quality(game_data)
-            quality_assessment['filter_results']['timing'] = timing_filter
+            # Filters that do not depend on the spread
+            if static_results is None:
+                static_results = {}
+            if not static_results:
+                # Conference tiers feed both the opponent and conference filters
+                tiers = self._get_conference_tiers(game_data)
+                static_results['opponents'] = self._evaluate_opponent_quality(game_data, fcs_status, tiers)
+                static_results['conference'] = self._evaluate_conference_quality(game_data, tiers)
+                static_results['timing'] = self._evaluate_timing_quality(game_data)
+                static_results['weather'] = self._evaluate_weather_impact(game_data)
             
-            weather_filter = self._evaluate_weather_impact(game_data)
-            quality_assessment['filter_results']['weather'] = weather_filter
+            # Run all quality filters; cached results are copied so callers
+            # can modify one assessment without changing later rescores
+            filter_results = {
+                'spread': self._evaluate_spread_quality(game_data),
+                'opponents': self._copy_filter_result(static_results['opponents']),
+                'data': self._evaluate_data_quality(game_data),
+                'conference': self._copy_filter_result(static_results['conference']),
+                'timing': self._copy_filter_result(static_results['timing']),
+                'weather': self._copy_filter_result(static_results['weather'])
+            }
             
             # Calculate overall quality score
-            quality_score = self._calculate_quality_score(quality_assessment['filter_results'])
-            quality_assessment['quality_score'] = quality_score
+            quality_score = self._calculate_quality_score(filter_results)
             
             # Determine overall quality classification
-            if quality_score >= 0.8:
-                quality_assessment['overall_quality'] = 'PREMIUM'
-                quality_assessment['recommendations'].append('HIGH_CONFIDENCE_ANALYSIS')
-            elif quality_score >= 0.6:
-                quality_assessment['overall_quality'] = 'GOOD'
-                quality_assessment['recommendations'].append('STANDARD_ANALYSIS')
-            elif quality_score >= 0.4:
-                quality_assessment['overall_quality'] = 'FAIR'
-                quality_assessment['recommendations'].append('REDUCED_CONFIDENCE')
-            else:
-                quality_assessment['overall_quality'] = 'POOR'
-                quality_assessment['recommendations'].append('SKIP_ANALYSIS')
-                quality_assessment['should_analyze'] = False
-            
-            # Add specific warnings
-            quality_assessment['warnings'] = self._generate_quality_warnings(
-                quality_assessment['filter_results']
-            )
+            for min_score, overall_quality, recommendation in _QUALITY_LEVELS:
+                if quality_score >= min_score:
+                    break
             
-            return quality_assessment
+            return {
+                'overall_quality': overall_quality,
+                'quality_score': quality_score,
+                'filter_results': filter_results,
+                'recommendations': [recommendation],
+                'warnings': self._generate_quality_warnings(filter_results),
+                'should_analyze': overall_quality != 'POOR'
+            }
             
         except Exception as e:
             self.logger.error(f"Error evaluating game quality: {e}")
@@ -137,80 +312,106 @@ class GameQualityFilter:
                 'error': str(e)
             }
     
+    def _quick_reject_reason(self, game_data: Dict[str, Any], fcs_status: Dict[str, bool]) -> Optional[str]:
+        """
+        Return a warning tag if the game can be rejected without full evaluation.
+        
+        Also screens out malformed input up front, so expected bad data does
+        not go through the exception path.
+        """
+        if not isinstance(game_data, dict):
+            return 'DATA_INVALID_GAME'
+        
+        if not isinstance(game_data.get('vegas_spread'), (int, float)):
+            return 'SPREAD_NO_SPREAD_DATA'
+        
+        home_team = game_data.get('home_team')
+        away_team = game_data.get('away_team')
+        if not isinstance(home_team, str) or not isinstance(away_team, str):
+            return 'DATA_MISSING_TEAMS'
+        
+        if (self._lookup_fcs(home_team.upper(), fcs_status) or
+                self._lookup_fcs(away_team.upper(), fcs_status)):
+            return 'OPPONENTS_FCS_OPPONENT'
+        
+        return None
+    
+    def _lookup_fcs(self, team_name: str, fcs_status: Dict[str, bool]) -> bool:
+        """FCS check memoized in fcs_status for the current slate."""
+        is_fcs = fcs_status.get(team_name)
+        if is_fcs is None:
+            is_fcs = fcs_status[team_name] = self._is_fcs_team(team_name)
+        return is_fcs
+    
     def _evaluate_spread_quality(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate spread quality and variance."""
-        spread_eval = {
-            'quality': 'GOOD',
-            'score': 1.0,
-            'issues': []
-        }
+        spread_eval = dict(self._SPREAD_BASE)
         
         spread = game_data.get('vegas_spread')
         if spread is None:
             spread_eval['quality'] = 'POOR'
             spread_eval['score'] = 0.0
-            spread_eval['issues'].append('NO_SPREAD_DATA')
+            spread_eval['issues'] = ['NO_SPREAD_DATA']
             return spread_eval
         
+        issues = []
         abs_spread = abs(spread)
         
         # Check for extreme spreads
         if abs_spread > self.filter_criteria['max_spread']:
             spread_eval['quality'] = 'POOR'
             spread_eval['score'] = 0.2
-            spread_eval['issues'].append(f'EXTREME_SPREAD_{abs_spread}')
+            issues.append(f'EXTREME_SPREAD_{abs_spread}')
         elif abs_spread > 21:
             spread_eval['quality'] = 'FAIR'
             spread_eval['score'] = 0.6
-            spread_eval['issues'].append('HIGH_SPREAD')
+            issues.append('HIGH_SPREAD')
         elif abs_spread < self.filter_criteria['min_spread']:
             spread_eval['quality'] = 'FAIR'
             spread_eval['score'] = 0.7
-            spread_eval['issues'].append('PICK_EM_GAME')
+            issues.append('PICK_EM_GAME')
         
         # Check for suspicious line movement
         opening_spread = game_data.get('opening_spread')
         if opening_spread is not None:
             movement = abs(spread - opening_spread)
             if movement > 7:
-                spread_eval['issues'].append('MAJOR_LINE_MOVEMENT')
+                issues.append('MAJOR_LINE_MOVEMENT')
                 spread_eval['score'] *= 0.8
             elif movement > 3:
-                spread_eval['issues'].append('SIGNIFICANT_MOVEMENT')
+                issues.append('SIGNIFICANT_MOVEMENT')
                 spread_eval['score'] *= 0.9
         
+        if issues:
+            spread_eval['issues'] = issues
+        
         return spread_eval
     
-    def _evaluate_opponent_quality(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _evaluate_opponent_quality(self, game_data: Dict[str, Any],
+                                   fcs_status: Optional[Dict[str, bool]] = None,
+                                   tiers: Optional[Tuple[str, str]] = None) -> Dict[str, Any]:
         """Evaluate opponent quality and classification."""
-        opponent_eval = {
-            'quality': 'GOOD',
-            'score': 1.0,
-            'classification': 'P5_VS_P5',
-            'issues': []
-        }
-        
         home_team = game_data.get('home_team', '').upper()
         away_team = game_data.get('away_team', '').upper()
         
-        # Check for FCS opponents
-        home_is_fcs = self._is_fcs_team(home_team)
-        away_is_fcs = self._is_fcs_team(away_team)
+        # Check for FCS opponents (memoized per team across a slate)
+        if fcs_status is None:
+            fcs_status = {}
+        home_is_fcs = self._lookup_fcs(home_team, fcs_status)
+        away_is_fcs = self._lookup_fcs(away_team, fcs_status)
         
         if home_is_fcs or away_is_fcs:
-            opponent_eval['quality'] = 'POOR'
-            opponent_eval['score'] = 0.3
-            opponent_eval['classification'] = 'FCS_GAME'
-            opponent_eval['issues'].append('FCS_OPPONENT')
-            return opponent_eval
+            return dict(self._FCS_OPPONENT_RESULT)
+        
+        opponent_eval = dict(self._OPPONENT_BASE)
         
         # Classify by conference
-        home_conf_tier = self._get_conference_tier(game_data.get('home_team_data', {}))
-        away_conf_tier = self._get_conference_tier(game_data.get('away_team_data', {}))
+        if tiers is None:
+            tiers = self._get_conference_tiers(game_data)
+        home_conf_tier, away_conf_tier = tiers
         
         if home_conf_tier == 'POWER' and away_conf_tier == 'POWER':
-            opponent_eval['classification'] = 'P5_VS_P5'
-            opponent_eval['score'] = 1.0
+            pass  # P5_VS_P5 with a full score is the base result
         elif home_conf_tier == 'GROUP_5' and away_conf_tier == 'GROUP_5':
             opponent_eval['classification'] = 'G5_VS_G5'
             opponent_eval['score'] = 0.8
@@ -221,53 +422,36 @@ class GameQualityFilter:
             opponent_eval['classification'] = 'OTHER'
             opponent_eval['quality'] = 'FAIR'
             opponent_eval['score'] = 0.6
-            opponent_eval['issues'].append('LOWER_TIER_MATCHUP')
+            opponent_eval['issues'] = ['LOWER_TIER_MATCHUP']
         
         return opponent_eval
     
     def _evaluate_data_quality(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate completeness and quality of available data."""
-        data_eval = {
-            'quality': 'GOOD',
-            'score': 1.0,
-            'completeness': 0.0,
-            'missing_data': []
-        }
-        
-        # Check for essential data fields
-        essential_fields = [
-            'home_team', 'away_team', 'vegas_spread', 'week'
-        ]
+        data_eval = dict(self._DATA_BASE)
         
-        optional_fields = [
-            'home_team_data', 'away_team_data', 'weather', 'tv_coverage'
-        ]
-        
-        # Count available data
-        total_fields = len(essential_fields) + len(optional_fields)
-        available_fields = 0
-        
-        for field in essential_fields:
-            if game_data.get(field) is not None:
-                available_fields += 1
-            else:
-                data_eval['missing_data'].append(field)
-        
-        for field in optional_fields:
-            if game_data.get(field) is not None:
-                available_fields += 1
+        # Presence bitmask over the fixed field schema
+        get = game_data.get
+        mask = 0
+        for bit, field in enumerate(self._DATA_FIELDS):
+            if get(field) is not None:
+                mask |= 1 << bit
         
         # Calculate completeness
-        data_eval['completeness'] = available_fields / total_fields
+        completeness = mask.bit_count() / len(self._DATA_FIELDS)
+        data_eval['completeness'] = completeness
         
         # Assess data quality
-        if data_eval['missing_data']:
+        if mask & self._ESSENTIAL_MASK != self._ESSENTIAL_MASK:
+            data_eval['missing_data'] = [
+                field for bit, field in enumerate(self._ESSENTIAL_FIELDS) if not mask >> bit & 1
+            ]
             data_eval['quality'] = 'POOR'
             data_eval['score'] = 0.3
-        elif data_eval['completeness'] >= 0.8:
+        elif completeness >= 0.8:
             data_eval['quality'] = 'EXCELLENT'
             data_eval['score'] = 1.0
-        elif data_eval['completeness'] >= 0.6:
+        elif completeness >= 0.6:
             data_eval['quality'] = 'GOOD'
             data_eval['score'] = 0.85
         else:
@@ -276,14 +460,11 @@ class GameQualityFilter:
         
         return data_eval
     
-    def _evaluate_conference_quality(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _evaluate_conference_quality(self, game_data: Dict[str, Any],
+                                     tiers: Optional[Tuple[str, str]] = None) -> Dict[str, Any]:
         """Evaluate conference quality and matchup significance."""
-        conf_eval = {
-            'quality': 'GOOD',
-            'score': 1.0,
-            'significance': 'CONFERENCE',
-            'factors': []
-        }
+        conf_eval = dict(self._CONFERENCE_BASE)
+        factors = []
         
         home_data = game_data.get('home_team_data', {})
         away_data = game_data.get('away_team_data', {})
@@ -293,118 +474,114 @@ class GameQualityFilter:
         
         # Conference game bonus
         if home_conf == away_conf and home_conf:
-            conf_eval['significance'] = 'CONFERENCE'
-            conf_eval['factors'].append('CONFERENCE_GAME')
+            factors.append('CONFERENCE_GAME')
             conf_eval['score'] *= 1.1
         
         # Rivalry game detection (basic)
         if self._is_rivalry_game(game_data):
             conf_eval['significance'] = 'RIVALRY'
-            conf_eval['factors'].append('RIVALRY')
+            factors.append('RIVALRY')
             conf_eval['score'] *= 0.9  # More unpredictable
         
         # Power conference boost
-        home_tier = self._get_conference_tier(home_data)
-        away_tier = self._get_conference_tier(away_data)
+        if tiers is None:
+            tiers = self._get_conference_tiers(game_data)
+        home_tier, away_tier = tiers
         
         if home_tier == 'POWER' and away_tier == 'POWER':
-            conf_eval['factors'].append('POWER_MATCHUP')
+            factors.append('POWER_MATCHUP')
             conf_eval['score'] *= 1.05
         
+        if factors:
+            conf_eval['factors'] = factors
+        
         return conf_eval
     
     def _evaluate_timing_quality(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate game timing factors."""
-        timing_eval = {
-            'quality': 'GOOD',
-            'score': 1.0,
-            'factors': []
-        }
+        timing_eval = dict(self._TIMING_BASE)
+        factors = []
         
-        week = game_data.get('week', 4)
+        week = game_data.get('week')
+        if week is None:
+            week = 4
         
         # Early season adjustment
         if week <= 2:
-            timing_eval['factors'].append('EARLY_SEASON')
+            factors.append('EARLY_SEASON')
             timing_eval['score'] *= 0.8
         elif week <= 3:
-            timing_eval['factors'].append('EARLY_SEASON_MINOR')
+            factors.append('EARLY_SEASON_MINOR')
             timing_eval['score'] *= 0.9
         
         # Late season/playoff implications
         if week >= 12:
-            timing_eval['factors'].append('LATE_SEASON')
+            factors.append('LATE_SEASON')
             timing_eval['score'] *= 1.05
         
         # Check for bye week impacts
         if self._has_bye_week_impact(game_data):
-            timing_eval['factors'].append('BYE_WEEK_IMPACT')
+            factors.append('BYE_WEEK_IMPACT')
             timing_eval['score'] *= 1.1
         
         # TV coverage boost (more scrutinized lines)
         if game_data.get('tv_coverage') or game_data.get('is_primetime'):
-            timing_eval['factors'].append('TV_COVERAGE')
+            factors.append('TV_COVERAGE')
             timing_eval['score'] *= 1.05
         
+        if factors:
+            timing_eval['factors'] = factors
+        
         return timing_eval
     
     def _evaluate_weather_impact(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate weather impact on game quality."""
-        weather_eval = {
-            'quality': 'GOOD',
-            'score': 1.0,
-            'impact': 'MINIMAL',
-            'factors': []
-        }
+        weather_eval = dict(self._WEATHER_BASE)
         
         weather = game_data.get('weather', {})
         if not weather:
             return weather_eval
         
+        factors = []
+        
         # Wind impact
         wind_speed = weather.get('wind_speed', 0)
         if wind_speed > self.filter_criteria['max_weather_impact']:
             weather_eval['quality'] = 'POOR'
             weather_eval['score'] = 0.6
             weather_eval['impact'] = 'HIGH'
-            weather_eval['factors'].append(f'HIGH_WIND_{wind_speed}')
+            factors.append(f'HIGH_WIND_{wind_speed}')
         elif wind_speed > 15:
             weather_eval['quality'] = 'FAIR'
             weather_eval['score'] = 0.8
             weather_eval['impact'] = 'MODERATE'
-            weather_eval['factors'].append('MODERATE_WIND')
+            factors.append('MODERATE_WIND')
         
         # Precipitation
         precipitation = weather.get('precipitation_probability', 0)
         if precipitation > 70:
-            weather_eval['factors'].append('HIGH_PRECIP')
+            factors.append('HIGH_PRECIP')
             weather_eval['score'] *= 0.9
         
         # Temperature extremes
         temp = weather.get('temperature')
         if temp is not None:
             if temp < 20 or temp > 100:
-                weather_eval['factors'].append('EXTREME_TEMP')
+                factors.append('EXTREME_TEMP')
                 weather_eval['score'] *= 0.9
         
+        if factors:
+            weather_eval['factors'] = factors
+        
         return weather_eval
     
     def _calculate_quality_score(self, filter_results: Dict) -> float:
         """Calculate overall quality score from all filters."""
-        weights = {
-            'spread': 0.25,
-            'opponents': 0.25,
-            'data': 0.20,
-            'conference': 0.15,
-            'timing': 0.10,
-            'weather': 0.05
-        }
-        
         total_score = 0.0
         
-        for filter_name, weight in weights.items():
-            filter_result = filter_results.get(filter_name, {})
-            filter_score = filter_result.get('score', 0.5)
+        for filter_name, weight in self.quality_weights:
+            filter_result = filter_results.get(filter_name)
+            filter_score = filter_result.get('score', 0.5) if filter_result is not None else 0.5
             total_score += filter_score * weight
         
         return min(1.0, max(0.0, total_score))
@@ -412,19 +589,23 @@ class GameQualityFilter:
     def _generate_quality_warnings(self, filter_results: Dict) -> List[str]:
         """Generate warnings based on filter results."""
         warnings = []
+        seen = set()
         
         for filter_name, result in filter_results.items():
-            issues = result.get('issues', [])
-            for issue in issues:
-                if issue not in warnings:
-                    warnings.append(f"{filter_name.upper()}_{issue}")
+            for issue in result.get('issues', ()):
+                warning = f"{filter_name.upper()}_{issue}"
+                if warning not in seen:
+                    seen.add(warning)
+                    warnings.append(warning)
         
         return warnings
     
     def _is_fcs_team(self, team_name: str) -> bool:
         """Check if team is FCS level."""
-        normalized_name = normalizer.normalize(team_name).upper()
-        return any(fcs in normalized_name for fcs in self.fcs_schools)
+        normalized_name = _norm_upper(team_name)
+        if normalized_name in self.fcs_schools:
+            return True
+        return self._fcs_pattern.search(normalized_name) is not None
     
     def _get_conference_tier(self, team_data: Dict) -> str:
         """Get conference tier (POWER, GROUP_5, FCS, OTHER)."""
@@ -437,13 +618,23 @@ class GameQualityFilter:
         
         conf_name = conference_info.get('name', '').upper()
         
-        if any(power in conf_name for power in self.power_conferences):
+        # Exact names are a set lookup; longer names fall back to a keyword search
+        if conf_name in self.power_conferences:
+            return 'POWER'
+        elif conf_name in self.group_of_5:
+            return 'GROUP_5'
+        elif self._power_pattern.search(conf_name):
             return 'POWER'
-        elif any(g5 in conf_name for g5 in self.group_of_5):
+        elif self._group_of_5_pattern.search(conf_name):
             return 'GROUP_5'
         else:
             return 'OTHER'
     
+    def _get_conference_tiers(self, game_data: Dict[str, Any]) -> Tuple[str, str]:
+        """Conference tiers of the home and away teams."""
+        return (self._get_conference_tier(game_data.get('home_team_data', {})),
+                self._get_conference_tier(game_data.get('away_team_data', {})))
+    
     def _get_conference_name(self, team_data: Dict) -> str:
         """Extract conference name from team data."""
         if not team_data:
@@ -453,45 +644,96 @@ class GameQualityFilter:
     
     def _is_rivalry_game(self, game_data: Dict) -> bool:
         """Detect rivalry games (basic implementation)."""
-        # Would need comprehensive rivalry database
-        home_team = game_data.get('home_team', '').upper()
-        away_team = game_data.get('away_team', '').upper()
-        
-        # Basic rivalry pairs (partial list)
-        rivalries = [
-            ('ALABAMA', 'AUBURN'), ('OHIO STATE', 'MICHIGAN'),
-            ('TEXAS', 'OKLAHOMA'), ('USC', 'UCLA'),
-            ('FLORIDA', 'GEORGIA'), ('CLEMSON', 'SOUTH CAROLINA')
-        ]
-        
-        for team1, team2 in rivalries:
-            if (team1 in home_team and team2 in away_team) or \
-               (team2 in home_team and team1 in away_team):
-                return True
+        home_team = game_data.get('home_team')
+        away_team = game_data.get('away_team')
+        if not home_team or not away_team:
+            return False
         
-        return False
+        # Exact names, so e.g. FLORIDA STATE does not match FLORIDA's rivalry
+        return _norm_upper(away_team) in self._rivalries.get(_norm_upper(home_team), ())
     
     def _has_bye_week_impact(self, game_data: Dict) -> bool:
         """Check for bye week advantages."""
         # Would need schedule data to determine bye weeks
         return False
     
-    def get_recommended_games(self, games: List[Dict]) -> List[Dict]:
-        """Filter and rank games by quality for analysis."""
+    def get_recommended_games(self, games: List[Dict], n_workers: int = 1) -> List[RatedGame]:
+        """
+        Filter and rank games by quality for analysis.
+        
+        Args:
+            games: Games to evaluate
+            n_workers: Worker processes for large slates (e.g. full-season
+                backtests); 1 evaluates serially in this process
+        
+        Returns:
+            Games worth analyzing, highest quality first
+        """
+        if n_workers > 1 and len(games) > self._PARALLEL_CHUNK_SIZE:
+            assessments = self._evaluate_games_parallel(games, n_workers)
+        else:
+            assessments = self.evaluate_games_batch(games)
+        
         quality_games = []
         
-        for game in games:
-            quality_assessment = self.evaluate_game_quality(game)
-            
+        for game, quality_assessment in zip(games, assessments):
             if quality_assessment['should_analyze']:
-                game_copy = game.copy()
-                game_copy['quality_assessment'] = quality_assessment
-                quality_games.append(game_copy)
+                quality_games.append(RatedGame(game, quality_assessment))
         
         # Sort by quality score (highest first)
-        quality_games.sort(key=lambda g: g['quality_assessment']['quality_score'], reverse=True)
+        quality_games.sort(key=_BY_SCORE, reverse=True)
         
         return quality_games
+    
+    def _evaluate_games_parallel(self, games: List[Dict], n_workers: int) -> List[Dict[str, Any]]:
+        """Evaluate chunks of a slate in worker processes, keeping game order."""
+        chunk_size = self._PARALLEL_CHUNK_SIZE
+        chunks = [games[i:i + chunk_size] for i in range(0, len(games), chunk_size)]
+        
+        assessments = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as executor:
+            for chunk_assessments in executor.map(self.evaluate_games_batch, chunks):
+                assessments.extend(chunk_assessments)
+        
+        return assessments
+
+
+class GameSlate:
+    """
+    A slate of games parsed once and rescored as lines move.
+    
+    The slate keeps its own shallow copy of each game. Team lookups and the
+    filters that do not depend on the spread are computed on the first score
+    and reused, so rescore() with new spreads only reruns the spread-dependent
+    work.
+    """
+    
+    def __init__(self, games: List[Dict[str, Any]], quality_filter: Optional[GameQualityFilter] = None):
+        self.games = [dict(game) if isinstance(game, dict) else game for game in games]
+        self.quality_filter = quality_filter or game_quality_filter
+        self._fcs_status: Dict[str, bool] = {}
+        self._static_results: List[Dict[str, Dict[str, Any]]] = [{} for _ in self.games]
+    
+    def rescore(self, spreads: Optional[Sequence[Optional[float]]] = None) -> List[Dict[str, Any]]:
+        """
+        Score every game in the slate.
+        
+        Args:
+            spreads: New vegas spreads, one per game in slate order
+            
+        Returns:
+            Quality assessments in slate order
+        """
+        if spreads is not None:
+            for game, spread in zip(self.games, spreads):
+                game['vegas_spread'] = spread
+        
+        assess_game = self.quality_filter._assess_game
+        fcs_status = self._fcs_status
+        return [
+            assess_game(game, fcs_status, static_results)
+            for game, static_results in zip(self.games, self._static_results)
+        ]
 
 
 # Global instance
@@ -3,14 +3,66 @@ Market Efficiency Detector for College Football Market Edge Platform.
 Identifies betting market inefficiencies and sharp money movements.
 """
 
+import functools
 import logging
+import math
+import re
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
-import statistics
+from types import MappingProxyType
 
 from config import config
 
 
+# Name keywords suggesting an FCS program, matched as whole words in one scan
+# (so 'NORTHWESTERN' does not match 'WESTERN')
+_FCS_KEYWORD_PATTERN = re.compile(
+    r'\b(?:STATE|SOUTHERN|EASTERN|WESTERN|NORTHERN|A&M|A&T|PRAIRIE|VALLEY)\b',
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_fcs_name(team_name: str) -> bool:
+    """Check if a team name looks like an FCS program."""
+    # Simple heuristic (would need team classification data to be exact)
+    return _FCS_KEYWORD_PATTERN.search(team_name) is not None
+
+
+@functools.lru_cache(maxsize=64)
+def _game_efficiency(early_season: bool, is_fcs: bool, is_primetime: bool,
+                     is_rivalry: bool, is_conference: bool) -> Tuple[float, float, Tuple[Tuple[str, float], ...]]:
+    """Base efficiency, clamped final efficiency and modifiers for one combination of game flags."""
+    modifiers = []
+    base_efficiency = 1.0
+    
+    # Early season modifier
+    if early_season:
+        modifiers.append(('early_season', 0.8))
+        base_efficiency *= 0.8
+    
+    # FCS opponent
+    if is_fcs:
+        modifiers.append(('fcs_opponent', 0.6))
+        base_efficiency *= 0.6
+    
+    # Primetime game (more efficient)
+    if is_primetime:
+        modifiers.append(('primetime', 1.2))
+        base_efficiency *= 1.2
+    
+    # Rivalry game (less efficient, emotional betting)
+    if is_rivalry:
+        modifiers.append(('rivalry', 0.85))
+        base_efficiency *= 0.85
+    
+    # Conference game
+    if is_conference:
+        modifiers.append(('conference', 1.0))
+    
+    return base_efficiency, max(0.3, min(1.5, base_efficiency)), tuple(modifiers)
+
+
 class MarketEfficiencyDetector:
     """
     Analyzes betting market efficiency to identify value opportunities.
@@ -27,13 +79,19 @@ class MarketEfficiencyDetector:
         """Initialize market efficiency detector."""
         self.logger = logging.getLogger(__name__)
         
-        # Market efficiency thresholds
-        self.efficiency_thresholds = {
+        # Market efficiency thresholds (read-only: the analysis reads the
+        # scalar copies below, so edits here could never take effect)
+        self.efficiency_thresholds = MappingProxyType({
             'line_movement': 2.5,  # Points of line movement considered significant
             'sharp_threshold': 0.7,  # Confidence threshold for sharp money
             'public_fade_threshold': 75,  # % of public on one side to consider fading
             'reverse_line_movement': True  # Track when line moves against public %
-        }
+        })
+        
+        # Scalar copies of the thresholds for the per-game analysis
+        self._line_movement_threshold = self.efficiency_thresholds['line_movement']
+        self._line_drift_threshold = self._line_movement_threshold / 2
+        self._public_fade_threshold = self.efficiency_thresholds['public_fade_threshold']
         
         # Game type efficiency multipliers
         self.game_type_efficiency = {
@@ -60,6 +118,29 @@ class MarketEfficiencyDetector:
         Returns:
             Market efficiency analysis with recommendations
         """
+        return self.analyze_batch([game_data], historical_data)[0]
+    
+    def analyze_batch(self, games: List[Dict[str, Any]],
+                      historical_data: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """
+        Analyze market efficiency for each game in a slate.
+        
+        This is a convenience loop over the per-game analysis; nothing is
+        shared per slate. Team classification and game-type efficiency use
+        module-level caches that persist across calls, so batching games
+        is no faster than analyzing them one at a time.
+        
+        Args:
+            games: Current game information including lines, one dict per game
+            historical_data: Optional historical market performance
+            
+        Returns:
+            Market efficiency analyses in the same order as games
+        """
+        return [self._analyze_game(game_data, historical_data) for game_data in games]
+    
+    def _analyze_game(self, game_data: Dict[str, Any], historical_data: Optional[Dict]) -> Dict[str, Any]:
+        """Run the full efficiency analysis for one game."""
         try:
             efficiency_analysis = {
                 'efficiency_score': 0.0,
@@ -130,41 +211,43 @@ class MarketEfficiencyDetector:
     
     def _analyze_line_movement(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze betting line movement patterns."""
-        movement_analysis = {
-            'total_movement': 0.0,
-            'direction': 'STABLE',
-            'significance': 'LOW',
-            'pattern': None
-        }
-        
         # Get opening and current lines
         opening_line = game_data.get('opening_spread')
         current_line = game_data.get('vegas_spread')
         
         if opening_line is None or current_line is None:
-            return movement_analysis
+            return {
+                'total_movement': 0.0,
+                'direction': 'STABLE',
+                'significance': 'LOW',
+                'pattern': None
+            }
         
         # Calculate movement
         total_movement = abs(current_line - opening_line)
-        movement_analysis['total_movement'] = total_movement
         
         # Determine direction
         if current_line > opening_line:
-            movement_analysis['direction'] = 'TOWARD_HOME'
+            direction = 'TOWARD_HOME'
         elif current_line < opening_line:
-            movement_analysis['direction'] = 'TOWARD_AWAY'
+            direction = 'TOWARD_AWAY'
+        else:
+            direction = 'STABLE'
         
         # Assess significance
-        if total_movement >= self.efficiency_thresholds['line_movement']:
-            movement_analysis['significance'] = 'HIGH'
-            movement_analysis['pattern'] = 'SHARP_MOVE'
-        elif total_movement >= self.efficiency_thresholds['line_movement'] / 2:
-            movement_analysis['significance'] = 'MODERATE'
-            movement_analysis['pattern'] = 'STEADY_DRIFT'
+        if total_movement >= self._line_movement_threshold:
+            significance, pattern = 'HIGH', 'SHARP_MOVE'
+        elif total_movement >= self._line_drift_threshold:
+            significance, pattern = 'MODERATE', 'STEADY_DRIFT'
         else:
-            movement_analysis['pattern'] = 'STABLE'
+            significance, pattern = 'LOW', 'STABLE'
         
-        return movement_analysis
+        return {
+            'total_movement': total_movement,
+            'direction': direction,
+            'significance': significance,
+            'pattern': pattern
+        }
     
     def _detect_sharp_public_split(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
         """Detect sharp vs public money indicators."""
@@ -195,7 +278,7 @@ class MarketEfficiencyDetector:
                 sharp_public['sharp_side'] = 'UNDERDOG'
         
         # Check for public fade opportunity
-        if public_pct >= self.efficiency_thresholds['public_fade_threshold']:
+        if public_pct >= self._public_fade_threshold:
             sharp_public['fade_public'] = True
         
         return sharp_public
@@ -243,11 +326,14 @@ class MarketEfficiencyDetector:
         # Get spreads from multiple books if available
         spreads = game_data.get('all_spreads', [game_data.get('vegas_spread')])
         spreads = [s for s in spreads if s is not None]
-        
-        if len(spreads) > 1:
-            # Calculate variance
-            mean_spread = statistics.mean(spreads)
-            spread_variance = statistics.stdev(spreads) if len(spreads) > 1 else 0
+        book_count = len(spreads)
+        
+        if book_count > 1:
+            # Calculate variance (sample stdev from one list of deviations,
+            # which the outlier check below reuses)
+            mean_spread = math.fsum(spreads) / book_count
+            deviations = [spread - mean_spread for spread in spreads]
+            spread_variance = math.sqrt(math.fsum(d * d for d in deviations) / (book_count - 1))
             consensus['spread_variance'] = spread_variance
             
             # Determine consensus level
@@ -259,53 +345,31 @@ class MarketEfficiencyDetector:
                 consensus['consensus_level'] = 'HIGH'
             
             # Identify outliers
-            for i, spread in enumerate(spreads):
-                if abs(spread - mean_spread) > 1.5:
-                    consensus['outlier_books'].append({
-                        'book_index': i,
-                        'spread': spread,
-                        'deviation': spread - mean_spread
-                    })
+            consensus['outlier_books'] = [
+                {'book_index': i, 'spread': spread, 'deviation': deviation}
+                for i, (spread, deviation) in enumerate(zip(spreads, deviations))
+                if abs(deviation) > 1.5
+            ]
         
         return consensus
     
     def _calculate_game_efficiency(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate game-specific market efficiency."""
-        efficiency = {
-            'base_efficiency': 1.0,
-            'modifiers': [],
-            'final_efficiency': 1.0
-        }
-        
         week = game_data.get('week', 4)
         
-        # Early season modifier
-        if week <= 3:
-            efficiency['modifiers'].append(('early_season', 0.8))
-            efficiency['base_efficiency'] *= 0.8
-        
-        # Check for FCS opponent
-        if self._is_fcs_game(game_data):
-            efficiency['modifiers'].append(('fcs_opponent', 0.6))
-            efficiency['base_efficiency'] *= 0.6
-        
-        # Primetime game (more efficient)
-        if game_data.get('is_primetime', False):
-            efficiency['modifiers'].append(('primetime', 1.2))
-            efficiency['base_efficiency'] *= 1.2
-        
-        # Rivalry game (less efficient, emotional betting)
-        if game_data.get('is_rivalry', False):
-            efficiency['modifiers'].append(('rivalry', 0.85))
-            efficiency['base_efficiency'] *= 0.85
-        
-        # Conference game
-        if game_data.get('is_conference', False):
-            efficiency['modifiers'].append(('conference', 1.0))
+        base_efficiency, final_efficiency, modifiers = _game_efficiency(
+            week <= 3,
+            self._is_fcs_game(game_data),
+            bool(game_data.get('is_primetime', False)),
+            bool(game_data.get('is_rivalry', False)),
+            bool(game_data.get('is_conference', False))
+        )
         
-        efficiency['final_efficiency'] = max(0.3, min(1.5, efficiency['base_efficiency']))
-        
-        return efficiency
+        return {
+            'base_efficiency': base_efficiency,
+            'modifiers': list(modifiers),
+            'final_efficiency': final_efficiency
+        }
     
     def _calculate_efficiency_score(self, line_movement: Dict, sharp_public: Dict,
                                    rlm: Dict, consensus: Dict, 
@@ -376,16 +440,8 @@ class MarketEfficiencyDetector:
     
     def _is_fcs_game(self, game_data: Dict) -> bool:
         """Check if game involves FCS opponent."""
-        # Would need team classification data
-        home_team = game_data.get('home_team', '').upper()
-        away_team = game_data.get('away_team', '').upper()
-        
-        fcs_keywords = ['STATE', 'SOUTHERN', 'EASTERN', 'WESTERN', 'NORTHERN', 
-                       'A&M', 'A&T', 'PRAIRIE', 'VALLEY']
-        
-        # Simple heuristic (would be better with actual conference data)
-        return any(keyword in home_team for keyword in fcs_keywords) or \
-               any(keyword in away_team for keyword in fcs_keywords)
+        return (_is_fcs_name(game_data.get('home_team', '')) or
+                _is_fcs_name(game_data.get('away_team', '')))
     
     def _add_historical_context(self, historical_data: Dict, 
                                game_data: Dict) -> Dict[str, Any]:
@@ -47,6 +47,7 @@ class BaseFactorCalculator(ABC):
         self.activation_threshold = 0.5  # Minimum absolute value to activate
         self.max_impact = 5.0  # Maximum adjustment this factor can make
         self.is_multiplicative = False  # Whether this factor multiplies vs adds
+        self.is_deterministic = False  # Whether calculate() is pure (no randomness or live data)
         
         # Logging
         self.logger = logging.getLogger(f"factors.{self.name.lower()}")
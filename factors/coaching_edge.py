@@ -25,6 +25,7 @@ class ExperienceDifferentialCalculator(BaseFactorCalculator):
         self.description = "Coaching experience differential analysis"
         self._min_output = -2.0
         self._max_output = 2.0
+        self.is_deterministic = True  # Pure function of coaching experience and tenure in context
         
         # Mark as PRIMARY factor - experience differential is a strong contrarian signal
         self.factor_type = FactorType.PRIMARY
@@ -188,6 +189,9 @@ class PressureSituationCalculator(BaseFactorCalculator):
         self.description = "Coaching performance under pressure analysis"
         self._min_output = -2.0
         self._max_output = 2.0
+        # Pure function of team names (md5-seeded, not random), week, spread and
+        # team records in context; the context is never modified
+        self.is_deterministic = True
         
         # Configuration
         self.config = {
@@ -210,11 +214,12 @@ class PressureSituationCalculator(BaseFactorCalculator):
         home_data = context.get('home_team_data', {})
         away_data = context.get('away_team_data', {})
         
-        # Add team names to data if not present
+        # Add team names to data if not present (on copies, so the caller's
+        # context is not changed and later calls cannot see this call's teams)
         if 'team_name' not in home_data:
-            home_data['team_name'] = home_team
+            home_data = {**home_data, 'team_name': home_team}
         if 'team_name' not in away_data:
-            away_data['team_name'] = away_team
+            away_data = {**away_data, 'team_name': away_team}
         
         # Calculate pressure scores for each team
         home_pressure = self._calculate_pressure_score(home_data, context, is_home=True)
@@ -359,6 +364,7 @@ class HeadToHeadRecordCalculator(BaseFactorCalculator):
         self.description = "Head-to-head coaching record analysis"
         self._min_output = -1.0
         self._max_output = 1.0
+        self.is_deterministic = True  # Pure function of the head-to-head record in context
         
         # Configuration
         self.config = {
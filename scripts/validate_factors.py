@@ -24,7 +24,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from engine.factor_validator import factor_validator, ValidationResult
+from engine.factor_validator import factor_validator, ValidationResult, FactorOutputs
 from factors.factor_registry import factor_registry
 
 
@@ -138,6 +138,8 @@ def format_json_output(validation_results: dict) -> str:
             return [convert_enums(item) for item in obj]
         elif isinstance(obj, ValidationResult):
             return obj.value
+        elif isinstance(obj, FactorOutputs):
+            return convert_enums(obj.to_records())
         else:
             return obj
     
@@ -1,18 +1,26 @@
 """
 Test suite for engine components of the CFB Market Edge Platform.
-Tests market efficiency detector, adaptive calibrator, game filter, and dynamic weighter.
+Tests market efficiency detector, adaptive calibrator, game filter, dynamic weighter,
+and confidence calculator.
 """
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
+import copy
 import json
+import pickle
+import statistics
 import tempfile
 from pathlib import Path
 
 from engine.market_efficiency_detector import MarketEfficiencyDetector
 from engine.adaptive_calibrator import AdaptiveCalibrator
-from engine.game_filter import GameQualityFilter
-from engine.dynamic_weighter import DynamicWeighter
+from engine.game_filter import GameQualityFilter, GameSlate
+from engine.dynamic_weighter import DynamicWeighter, MatchedPrediction
+from engine.confidence_calculator import ConfidenceCalculator, ConfidenceComponents, PredictionType
+from engine.edge_detector import EdgeDetector, EdgeClassification, EdgeType, _format_explanation
+from engine.factor_validator import FactorValidator, ValidationResult, FactorOutputs
+from factors.coaching_edge import PressureSituationCalculator
 
 
 class TestMarketEfficiencyDetector(unittest.TestCase):
@@ -89,6 +97,57 @@ class TestMarketEfficiencyDetector(unittest.TestCase):
         # Should have rivalry modifier
         modifier_names = [mod[0] for mod in game_efficiency['modifiers']]
         self.assertIn('rivalry', modifier_names)
+    
+    def test_game_efficiency_cached_results_not_shared(self):
+        """Test that cached game efficiency returns independent modifier lists."""
+        first = self.detector._calculate_game_efficiency(self.sample_game_data)
+        first['modifiers'].append(('extra', 2.0))
+        
+        second = self.detector._calculate_game_efficiency(self.sample_game_data)
+        
+        self.assertEqual(second['modifiers'], [('rivalry', 0.85)])
+        self.assertAlmostEqual(second['final_efficiency'], 0.85)
+    
+    def test_fcs_game_keyword_matching(self):
+        """Test FCS heuristic matches whole keywords regardless of case."""
+        self.assertTrue(self.detector._is_fcs_game({'home_team': 'Alabama', 'away_team': 'Jackson State'}))
+        self.assertTrue(self.detector._is_fcs_game({'home_team': 'prairie view a&m', 'away_team': 'Alabama'}))
+        self.assertFalse(self.detector._is_fcs_game({'home_team': 'Northwestern', 'away_team': 'Southeastern'}))
+        self.assertFalse(self.detector._is_fcs_game(self.sample_game_data))
+    
+    def test_analyze_batch(self):
+        """Test that batch analysis matches per-game analysis in order."""
+        fcs_game = dict(self.sample_game_data, away_team='Prairie View', is_rivalry=False)
+        games = [self.sample_game_data, fcs_game, self.sample_game_data]
+        
+        batch = self.detector.analyze_batch(games)
+        
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch[0], self.detector.analyze_market_efficiency(self.sample_game_data))
+        self.assertEqual(batch[1], self.detector.analyze_market_efficiency(fcs_game))
+        self.assertIn(('fcs_opponent', 0.6), batch[1]['game_efficiency']['modifiers'])
+        self.assertEqual(batch[0], batch[2])
+    
+    def test_efficiency_thresholds_read_only(self):
+        """Test that threshold tuning fails loudly instead of being ignored."""
+        with self.assertRaises(TypeError):
+            self.detector.efficiency_thresholds['line_movement'] = 1.0
+        
+        line_movement = self.detector._analyze_line_movement(self.sample_game_data)
+        self.assertEqual(line_movement['significance'], 'MODERATE')
+    
+    def test_market_consensus_outliers(self):
+        """Test consensus spread deviation and outlier book detection."""
+        game_data = self.sample_game_data.copy()
+        game_data['all_spreads'] = [-14.5, -14.0, None, -14.5, -14.0, -18.0]
+        
+        consensus = self.detector._analyze_market_consensus(game_data)
+        
+        self.assertAlmostEqual(consensus['spread_variance'], statistics.stdev([-14.5, -14.0, -14.5, -14.0, -18.0]))
+        self.assertEqual(consensus['consensus_level'], 'LOW')
+        self.assertEqual(len(consensus['outlier_books']), 1)
+        self.assertEqual(consensus['outlier_books'][0]['book_index'], 4)
+        self.assertAlmostEqual(consensus['outlier_books'][0]['deviation'], -3.0)
 
 
 class TestAdaptiveCalibrator(unittest.TestCase):
@@ -244,6 +303,13 @@ class TestGameQualityFilter(unittest.TestCase):
         self.assertFalse(self.filter._is_fcs_team('Alabama'))
         self.assertFalse(self.filter._is_fcs_team('Ohio State'))
     
+    def test_rivalry_detection(self):
+        """Test rivalry detection matches exact team pairs in either order."""
+        self.assertTrue(self.filter._is_rivalry_game({'home_team': 'Auburn', 'away_team': 'Alabama'}))
+        self.assertTrue(self.filter._is_rivalry_game({'home_team': 'Georgia', 'away_team': 'Florida'}))
+        self.assertFalse(self.filter._is_rivalry_game({'home_team': 'Georgia Southern', 'away_team': 'Florida'}))
+        self.assertFalse(self.filter._is_rivalry_game({'home_team': 'Alabama'}))
+    
     def test_conference_tier_classification(self):
         """Test conference tier classification."""
         sec_data = {'info': {'conference': {'name': 'Southeastern Conference'}}}
@@ -252,6 +318,82 @@ class TestGameQualityFilter(unittest.TestCase):
         self.assertEqual(self.filter._get_conference_tier(sec_data), 'POWER')
         self.assertEqual(self.filter._get_conference_tier(aac_data), 'GROUP_5')
     
+    def test_missing_spread_rejected_early(self):
+        """Test that games without a spread skip the full set of filters."""
+        game = dict(self.high_quality_game, vegas_spread=None)
+        
+        with patch.object(self.filter, '_evaluate_weather_impact') as weather_filter:
+            result = self.filter.evaluate_game_quality(game)
+        
+        self.assertEqual(result['overall_quality'], 'POOR')
+        self.assertFalse(result['should_analyze'])
+        self.assertEqual(result['warnings'], ['SPREAD_NO_SPREAD_DATA'])
+        weather_filter.assert_not_called()
+    
+    def test_malformed_games_screened_without_errors(self):
+        """Test that common bad inputs are handled without the error path."""
+        no_week = dict(self.high_quality_game, week=None)
+        bad_spread = dict(self.high_quality_game, vegas_spread='-7.5')
+        
+        with patch.object(self.filter.logger, 'error') as log_error:
+            no_week_result = self.filter.evaluate_game_quality(no_week)
+            bad_spread_result = self.filter.evaluate_game_quality(bad_spread)
+            invalid_result = self.filter.evaluate_game_quality(None)
+        
+        log_error.assert_not_called()
+        self.assertNotEqual(no_week_result['overall_quality'], 'ERROR')
+        self.assertEqual(no_week_result['filter_results']['data']['missing_data'], ['week'])
+        self.assertEqual(bad_spread_result['warnings'], ['SPREAD_NO_SPREAD_DATA'])
+        self.assertEqual(invalid_result['warnings'], ['DATA_INVALID_GAME'])
+    
+    def test_evaluate_games_batch(self):
+        """Test that batch evaluation matches per-game evaluation in order."""
+        games = [self.high_quality_game, self.poor_quality_game, self.high_quality_game]
+        
+        batch = self.filter.evaluate_games_batch(games)
+        
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch[0], self.filter.evaluate_game_quality(self.high_quality_game))
+        self.assertEqual(batch[1]['should_analyze'], False)
+        self.assertEqual(batch[0], batch[2])
+    
+    def test_conference_tiers_computed_once_per_game(self):
+        """Test that the opponent and conference filters share one tier lookup."""
+        with patch.object(self.filter, '_get_conference_tier',
+                          wraps=self.filter._get_conference_tier) as get_tier:
+            result = self.filter.evaluate_game_quality(self.high_quality_game)
+        
+        self.assertEqual(get_tier.call_count, 2)
+        self.assertEqual(result['filter_results']['opponents']['classification'], 'P5_VS_P5')
+        self.assertIn('POWER_MATCHUP', result['filter_results']['conference']['factors'])
+    
+    def test_game_slate_rescore(self):
+        """Test that rescoring a slate with new spreads matches fresh evaluation."""
+        games = [self.high_quality_game, self.poor_quality_game]
+        slate = GameSlate(games, self.filter)
+        
+        self.assertEqual(slate.rescore(), self.filter.evaluate_games_batch(games))
+        
+        rescored = slate.rescore([-21.0, None])
+        moved = dict(self.high_quality_game, vegas_spread=-21.0)
+        self.assertEqual(rescored[0], self.filter.evaluate_game_quality(moved))
+        self.assertFalse(rescored[1]['should_analyze'])
+        self.assertEqual(self.high_quality_game['vegas_spread'], -7.5)
+
+    def test_game_slate_rescore_results_independent(self):
+        """Test that mutating one rescore's filter results does not leak into the next."""
+        slate = GameSlate([self.high_quality_game], self.filter)
+        first = slate.rescore()[0]['filter_results']
+        expected = copy.deepcopy(first)
+
+        first['conference']['score'] = 0.0
+        first['conference']['factors'].append('EDITED')
+        second = slate.rescore()[0]['filter_results']
+
+        self.assertIsNot(second['conference'], first['conference'])
+        self.assertIsNot(second['conference']['factors'], first['conference']['factors'])
+        self.assertEqual(second, expected)
+
     def test_recommended_games_filtering(self):
         """Test recommended games filtering and ranking."""
         games = [self.high_quality_game, self.poor_quality_game]
@@ -262,6 +404,38 @@ class TestGameQualityFilter(unittest.TestCase):
         self.assertEqual(len(recommended), 1)
         self.assertEqual(recommended[0]['home_team'], 'Alabama')
         self.assertEqual(recommended[0]['away_team'], 'Georgia')
+        self.assertIs(recommended[0].game, self.high_quality_game)
+        self.assertTrue(recommended[0]['quality_assessment']['should_analyze'])
+        self.assertNotIn('quality_assessment', self.high_quality_game)
+    
+    def test_recommended_games_behave_like_dicts(self):
+        """Test membership, iteration and serialization of recommended games."""
+        recommended = self.filter.get_recommended_games([self.high_quality_game])
+        rated = recommended[0]
+        
+        self.assertIn('quality_assessment', rated)
+        self.assertIn('home_team', rated)
+        self.assertNotIn('missing_field', rated)
+        self.assertEqual(list(rated), list(self.high_quality_game) + ['quality_assessment'])
+        self.assertEqual(len(rated), len(self.high_quality_game) + 1)
+        
+        expected = dict(self.high_quality_game, quality_assessment=rated['quality_assessment'])
+        self.assertEqual(dict(rated), expected)
+        self.assertEqual(rated.to_dict(), expected)
+        self.assertEqual(json.loads(json.dumps(rated.to_dict())), json.loads(json.dumps(expected)))
+
+
+    def test_recommended_games_parallel_matches_serial(self):
+        """Test that worker-process evaluation ranks games like the serial path."""
+        games = [dict(self.high_quality_game, vegas_spread=-float(i % 25)) for i in range(80)]
+        games.append(self.poor_quality_game)
+        
+        serial = self.filter.get_recommended_games(games)
+        parallel = self.filter.get_recommended_games(games, n_workers=2)
+        
+        self.assertEqual(len(parallel), len(serial))
+        self.assertEqual([g['vegas_spread'] for g in parallel], [g['vegas_spread'] for g in serial])
+        self.assertEqual([g.score for g in parallel], [g.score for g in serial])
 
 
 class TestDynamicWeighter(unittest.TestCase):
@@ -303,31 +477,56 @@ class TestDynamicWeighter(unittest.TestCase):
         total_weight = sum(weights.values())
         self.assertAlmostEqual(total_weight, 1.0, places=2)
     
-    def test_seasonal_adjustments(self):
-        """Test seasonal weight adjustments."""
-        base_weights = {'coaching_differential': 0.25, 'momentum_factors': 0.15}
+    def test_get_optimized_weights_batch(self):
+        """Test batch weights match per-context weights."""
+        contexts = [
+            self.sample_context,
+            {'week': 1, 'prediction_type': 'STRONG_CONTRARIAN'},
+            dict(self.sample_context),
+            {'week': 13}
+        ]
+        
+        batch = self.weighter.get_optimized_weights_batch(contexts)
+        
+        self.assertEqual(len(batch), len(contexts))
+        for context, weights in zip(contexts, batch):
+            expected = self.weighter.get_optimized_weights(context)
+            for factor, weight in expected.items():
+                self.assertAlmostEqual(weights[factor], weight, places=12)
         
-        # Early season should reduce coaching weight, momentum weight
-        early_context = {'week': 2}
-        early_weights = self.weighter._apply_seasonal_adjustments(base_weights, early_context)
+        # Contexts sharing a key must not share the same dict
+        self.assertIsNot(batch[0], batch[2])
+    
+    def test_seasonal_adjustments(self):
+        """Test seasonal multipliers in the context multiplier table."""
+        table = self.weighter._build_multiplier_table()
         
-        self.assertLess(early_weights['coaching_differential'], base_weights['coaching_differential'])
-        self.assertLess(early_weights['momentum_factors'], base_weights['momentum_factors'])
+        # Early season should reduce coaching and momentum weight
+        early = table[('early_season', None, None)]
+        self.assertLess(early['coaching_differential'], 1.0)
+        self.assertLess(early['momentum_factors'], 1.0)
         
         # Late season should increase desperation weight
-        late_context = {'week': 13}
-        late_weights = self.weighter._apply_seasonal_adjustments(base_weights, late_context)
-        # Would need desperation_index in base_weights to test this properly
+        late = table[('late_season', None, None)]
+        self.assertGreater(late['desperation_index'], 1.0)
+        
+        # Optimized weights pick the entry matching the context's week
+        early_weights = self.weighter.get_optimized_weights({'week': 2})
+        late_weights = self.weighter.get_optimized_weights({'week': 13})
+        self.assertLess(early_weights['momentum_factors'], late_weights['momentum_factors'])
     
     def test_conference_adjustments(self):
-        """Test conference-specific adjustments."""
-        base_weights = {'coaching_differential': 0.25, 'experience_differential': 0.2}
-        
-        sec_context = {'home_team_data': {'info': {'conference': {'name': 'SEC'}}}}
-        sec_weights = self.weighter._apply_conference_adjustments(base_weights, sec_context)
+        """Test conference multipliers in the context multiplier table."""
+        table = self.weighter._build_multiplier_table()
         
         # SEC should boost coaching and experience weights
-        self.assertGreaterEqual(sec_weights['coaching_differential'], base_weights['coaching_differential'])
+        sec = table[('mid_season', 'SEC', None)]
+        self.assertGreater(sec['coaching_differential'], 1.0)
+        self.assertGreater(sec['experience_differential'], 1.0)
+        
+        sec_context = {'week': 6, 'home_team_data': {'info': {'conference': {'name': 'SEC'}}},
+                       'prediction_type': 'UNKNOWN'}
+        self.assertEqual(self.weighter._get_context_multipliers(sec_context), sec)
     
     def test_weight_normalization(self):
         """Test weight normalization."""
@@ -345,18 +544,18 @@ class TestDynamicWeighter(unittest.TestCase):
     def test_factor_performance_analysis(self):
         """Test factor performance analysis."""
         matched_data = [
-            {
-                'correct': True,
-                'factors': {'coaching_differential': 0.5, 'momentum_factors': 0.3}
-            },
-            {
-                'correct': False,
-                'factors': {'coaching_differential': 0.2, 'momentum_factors': 0.8}
-            },
-            {
-                'correct': True,
-                'factors': {'coaching_differential': 0.7, 'momentum_factors': 0.1}
-            }
+            MatchedPrediction(
+                prediction={}, result={}, correct=True,
+                factors={'coaching_differential': 0.5, 'momentum_factors': 0.3}
+            ),
+            MatchedPrediction(
+                prediction={}, result={}, correct=False,
+                factors={'coaching_differential': 0.2, 'momentum_factors': 0.8}
+            ),
+            MatchedPrediction(
+                prediction={}, result={}, correct=True,
+                factors={'coaching_differential': 0.7, 'momentum_factors': 0.1}
+            )
         ]
         
         performance = self.weighter._analyze_factor_performance(matched_data)
@@ -367,6 +566,519 @@ class TestDynamicWeighter(unittest.TestCase):
         # Coaching should have better predictive power (higher values when correct)
         coaching_perf = performance['coaching_differential']
         self.assertGreater(coaching_perf['accuracy'], 0.5)  # 2/3 correct
+    
+    def test_weight_state_saved_only_when_dirty(self):
+        """Test that weight state is persisted only after an adjustment."""
+        self.weighter._save_weight_state()
+        self.assertFalse(self.weighter.weights_file.exists())
+        
+        self.weighter._apply_weight_adjustments({'coaching_differential': 0.3})
+        self.weighter.get_optimized_weights(self.sample_context)
+        multiplier_table = self.weighter._multiplier_cache
+        self.weighter._save_weight_state()
+        
+        # Saving does not change weights, so cached multipliers survive it
+        self.assertIs(self.weighter._multiplier_cache, multiplier_table)
+        self.assertTrue(self.weighter.weights_file.exists())
+        self.assertEqual(list(self.weighter.weights_file.parent.iterdir()), [self.weighter.weights_file])
+        self.assertEqual(self.weighter._load_weight_state(), self.weighter.weight_state)
+
+
+
+class TestConfidenceCalculator(unittest.TestCase):
+    """Test confidence calculation."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.calculator = ConfidenceCalculator()
+        
+        self.prediction_result = {
+            'edge_size': 2.8,
+            'prediction_type': 'MODERATE_CONTRARIAN'
+        }
+        self.factor_results = {
+            'summary': {'factors_calculated': 4, 'factors_successful': 4},
+            'factors': {
+                'SchedulingFatigue': {'success': True, 'value': 1.2, 'weight': 0.2},
+                'DesperationIndex': {'success': True, 'value': 0.8, 'weight': 0.2},
+                'RevengeGame': {'success': True, 'value': 0.0, 'weight': 0.1},
+                'StyleMismatch': {'success': False, 'value': 0.0, 'weight': 0.1}
+            }
+        }
+        self.context = {
+            'data_quality': 0.8,
+            'vegas_spread': -3.5,
+            'data_sources': ['odds_api', 'cfbd_api'],
+            'week': 7
+        }
+    
+    def test_confidence_level_boundaries(self):
+        """Test confidence level classification at threshold boundaries."""
+        expected = [
+            (0.10, 'Very Low'), (0.40, 'Low'), (0.54, 'Low'), (0.55, 'Medium'),
+            (0.70, 'High'), (0.84, 'High'), (0.85, 'Very High')
+        ]
+        for score, level in expected:
+            self.assertEqual(self.calculator._determine_confidence_level(score), level)
+    
+    def test_components_breakdown(self):
+        """Test that the components breakdown covers every weighted dimension."""
+        result = self.calculator.calculate_confidence(
+            self.prediction_result, self.factor_results, self.context
+        )
+        
+        self.assertEqual(list(result['components']), list(ConfidenceComponents._fields))
+        self.assertEqual(set(result['components']), set(result['weights']))
+        self.assertGreaterEqual(result['confidence_score'], 0.15)
+        self.assertLessEqual(result['confidence_score'], 0.85)
+        self.assertTrue(result['explanation'].startswith(result['confidence_level']))
+    
+    def test_score_only_assessment(self):
+        """Test that the breakdown and formatted strings are skipped when not requested."""
+        full = self.calculator.calculate_confidence(
+            self.prediction_result, self.factor_results, self.context
+        )
+        score_only = self.calculator.calculate_confidence(
+            self.prediction_result, self.factor_results, self.context, with_explanation=False
+        )
+        
+        self.assertEqual(score_only['confidence_score'], full['confidence_score'])
+        self.assertEqual(score_only['confidence_level'], full['confidence_level'])
+        self.assertNotIn('components', score_only)
+        self.assertNotIn('explanation', score_only)
+        self.assertNotIn('confidence_percentage', score_only)
+    
+    def test_error_prediction_short_circuits(self):
+        """Test that failed predictions get minimum confidence without assessment."""
+        with patch.object(self.calculator, '_assess_factor_consensus') as consensus:
+            result = self.calculator.calculate_confidence(
+                {'prediction_type': 'ERROR', 'edge_size': 0.0}, self.factor_results, self.context
+            )
+        
+        consensus.assert_not_called()
+        self.assertEqual(result['confidence_score'], 0.15)
+        self.assertEqual(result['confidence_level'], 'Very Low')
+        self.assertEqual(set(result['components']), set(ConfidenceComponents._fields))
+    
+    def test_prediction_type_enum_matches_name(self):
+        """Test that PredictionType members score like their string names."""
+        for prediction_type in PredictionType:
+            by_name = self.calculator.calculate_confidence(
+                dict(self.prediction_result, prediction_type=prediction_type.name),
+                self.factor_results, self.context
+            )
+            by_enum = self.calculator.calculate_confidence(
+                dict(self.prediction_result, prediction_type=prediction_type),
+                self.factor_results, self.context
+            )
+            self.assertEqual(by_enum, by_name)
+
+
+class TestEdgeDetector(unittest.TestCase):
+    """Test edge detection and slate-level edge summaries."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.detector = EdgeDetector()
+    
+    def _slate_entry(self, home_team, edge_type, edge_size, confidence):
+        """Build a prediction result carrying an edge classification."""
+        return {
+            'home_team': home_team,
+            'away_team': 'Visitor',
+            'edge_classification': EdgeClassification(
+                edge_type, edge_size, confidence, '', f"BUY - {home_team}"
+            )
+        }
+    
+    def test_classify_edge_size_boundaries(self):
+        """Test edge size classification at each threshold."""
+        expected = [
+            (0.0, EdgeType.NO_EDGE), (0.49, EdgeType.NO_EDGE),
+            (0.5, EdgeType.CONSENSUS_PLAY), (1.0, EdgeType.SLIGHT_CONTRARIAN),
+            (2.0, EdgeType.MODERATE_CONTRARIAN), (2.99, EdgeType.MODERATE_CONTRARIAN),
+            (3.0, EdgeType.STRONG_CONTRARIAN), (float('nan'), EdgeType.NO_EDGE),
+            (None, EdgeType.INSUFFICIENT_DATA)
+        ]
+        for edge_size, edge_type in expected:
+            self.assertEqual(self.detector._classify_edge_size(edge_size), edge_type)
+    
+    def test_missing_line_short_circuits(self):
+        """Test that games without a line skip classification entirely."""
+        prediction_result = {'edge_size': 4.0, 'vegas_spread': None, 'contrarian_spread': None}
+        with patch.object(EdgeDetector, '_classify_edge_size') as classify:
+            edge = self.detector.detect_edge(
+                prediction_result, {'confidence_score': 0.8}, {'data_quality': 0.9}
+            )
+        
+        classify.assert_not_called()
+        self.assertEqual(edge.edge_type, EdgeType.INSUFFICIENT_DATA)
+        self.assertEqual(edge.edge_size, 4.0)
+        self.assertTrue(edge.recommended_action.startswith('AVOID'))
+        self.assertIn('No betting line available', edge.explanation)
+    
+    def test_classify_batch_matches_detect_edge(self):
+        """Test that batch classification agrees with per-game detection."""
+        games = [
+            (3.5, 0.80, 0.9, -7.0, -3.5),
+            (3.5, 0.40, 0.9, -7.0, -3.5),
+            (2.5, 0.30, 0.9, -7.0, -4.5),
+            (0.7, None, 0.9, 3.0, 3.7),
+            (None, 0.70, 0.9, 3.0, 3.0),
+            (6.0, 0.90, 0.9, -14.0, -8.0),
+            (2.0, 0.70, 0.1, -3.0, -1.0),
+            (2.0, 0.70, 0.9, None, None)
+        ]
+        
+        batch = self.detector.classify_batch(*zip(*games))
+        
+        for edge_type, (edge_size, confidence, data_quality, vegas, contrarian) in zip(batch, games):
+            edge = self.detector.detect_edge(
+                {'edge_size': edge_size, 'vegas_spread': vegas, 'contrarian_spread': contrarian},
+                {'confidence_score': confidence},
+                {'data_quality': data_quality}
+            )
+            self.assertEqual(edge_type, edge.edge_type)
+        self.assertEqual(batch[0], EdgeType.STRONG_CONTRARIAN)
+        self.assertEqual(batch[1], EdgeType.SLIGHT_CONTRARIAN)
+    
+    def test_explanation_built_on_first_access(self):
+        """Test that the explanation is deferred until read and then kept."""
+        prediction_result = {
+            'edge_size': 2.5, 'vegas_spread': -7.0, 'contrarian_spread': -4.5,
+            'edge_direction': 'away', 'away_team': 'Visitor'
+        }
+        with patch('engine.edge_detector._format_explanation', return_value='text') as explain:
+            edge = self.detector.detect_edge(
+                prediction_result, {'confidence_score': 0.7}, {'data_quality': 0.9}
+            )
+            explain.assert_not_called()
+            
+            self.assertEqual(edge.explanation, 'text')
+            self.assertEqual(edge.explanation, 'text')
+        
+        explain.assert_called_once()
+        self.assertEqual(edge.edge_type, EdgeType.MODERATE_CONTRARIAN)
+    
+    def test_unread_explanation_pickles_and_copies(self):
+        """Test that a classification with a deferred explanation pickles and copies."""
+        prediction_result = {
+            'edge_size': 2.5, 'vegas_spread': -7.0, 'contrarian_spread': -4.5,
+            'edge_direction': 'away', 'away_team': 'Visitor',
+            'category_adjustments': {'coaching': 1.2}
+        }
+        edge = self.detector.detect_edge(
+            prediction_result, {'confidence_score': 0.7}, {'data_quality': 0.9}
+        )
+        
+        restored = pickle.loads(pickle.dumps(edge))
+        copied = copy.deepcopy(edge)
+        
+        self.assertEqual(restored, edge)
+        self.assertEqual(copied, edge)
+        self.assertEqual(restored.explanation, edge.explanation)
+        self.assertEqual(copied.explanation, edge.explanation)
+        self.assertIn("Primary driver: coaching factors (+1.20 points).", edge.explanation)
+    
+    def test_explanation_keeps_pickem_line_sign(self):
+        """Test that -0.0 and 0.0 Vegas lines are each formatted with their own sign."""
+        def vegas_text(vegas_spread):
+            return _format_explanation(
+                EdgeType.SLIGHT_CONTRARIAN, 1.5, 0.6, 'MEDIUM', None, 0.9, vegas_spread, 1.5
+            )
+        
+        self.assertIn("Vegas line: -0.0,", vegas_text(-0.0))
+        self.assertIn("Vegas line: +0.0,", vegas_text(0.0))
+    
+    def test_analyze_edge_opportunities(self):
+        """Test edge type counts and top recommendation ranking."""
+        slate = [
+            self._slate_entry('Alpha', EdgeType.MODERATE_CONTRARIAN, 2.5, 0.70),
+            self._slate_entry('Bravo', EdgeType.STRONG_CONTRARIAN, 4.0, 0.60),
+            self._slate_entry('Charlie', EdgeType.SLIGHT_CONTRARIAN, 1.5, 0.90),
+            self._slate_entry('Delta', EdgeType.STRONG_CONTRARIAN, 4.0, 0.80),
+            self._slate_entry('Echo', EdgeType.NO_EDGE, 0.1, 0.50),
+            {'home_team': 'Foxtrot', 'away_team': 'Visitor'}
+        ]
+        for index in range(5):
+            slate.append(self._slate_entry(f"Team{index}", EdgeType.MODERATE_CONTRARIAN, 2.0, 0.65))
+        
+        analysis = self.detector.analyze_edge_opportunities(slate)
+        
+        self.assertEqual(analysis['total_games'], 11)
+        self.assertEqual(analysis['strong_edges'], 2)
+        self.assertEqual(analysis['moderate_edges'], 6)
+        self.assertEqual(analysis['slight_edges'], 1)
+        self.assertEqual(analysis['no_edge_games'], 1)
+        self.assertEqual(analysis['edge_opportunities'], 9)
+        self.assertEqual(
+            [rec['game'] for rec in analysis['recommendations']],
+            ['Visitor @ Delta', 'Visitor @ Bravo', 'Visitor @ Alpha',
+             'Visitor @ Team0', 'Visitor @ Team1']
+        )
+        self.assertEqual(analysis['recommendations'][0]['edge_type'], 'strong_contrarian')
+    
+    def test_analyze_edge_opportunities_columns(self):
+        """Test that the column input matches the list-of-results summary."""
+        slate = [
+            self._slate_entry('Alpha', EdgeType.MODERATE_CONTRARIAN, 2.5, 0.70),
+            self._slate_entry('Bravo', EdgeType.STRONG_CONTRARIAN, 4.0, 0.60),
+            self._slate_entry('Charlie', EdgeType.CONSENSUS_PLAY, 0.6, 0.50)
+        ]
+        classifications = [entry['edge_classification'] for entry in slate]
+        
+        analysis = self.detector.analyze_edge_opportunities_columns(
+            [c.edge_type for c in classifications],
+            [c.edge_size for c in classifications],
+            [c.confidence for c in classifications],
+            ['Alpha', 'Bravo', 'Charlie'],
+            ['Visitor'] * 3,
+            [c.recommended_action for c in classifications]
+        )
+        
+        self.assertEqual(analysis, self.detector.analyze_edge_opportunities(slate))
+        self.assertEqual(analysis['consensus_plays'], 1)
+        self.assertEqual(analysis['recommendations'][0]['recommendation'], 'BUY - Bravo')
+    
+    def test_thresholds_read_only(self):
+        """Test that threshold tuning fails loudly instead of being ignored."""
+        with self.assertRaises(TypeError):
+            self.detector.edge_thresholds['strong_contrarian'] = 4.0
+        with self.assertRaises(TypeError):
+            self.detector.confidence_thresholds['medium_confidence'] = 0.5
+        
+        self.assertEqual(self.detector._classify_edge_size(3.5), EdgeType.STRONG_CONTRARIAN)
+    
+    def test_edge_detection_stats_json_friendly(self):
+        """Test that stats are plain data matching the configuration."""
+        stats = self.detector.get_edge_detection_stats()
+        
+        self.assertEqual(stats['edge_thresholds']['strong_contrarian'], 3.0)
+        self.assertIsInstance(stats['edge_types'], list)
+        self.assertIn('insufficient_data', stats['edge_types'])
+        self.assertEqual(json.loads(json.dumps(stats)), stats)
+        
+        # Returned copies do not alias the detector's configuration
+        stats['risk_parameters']['max_recommended_edge'] = 10.0
+        self.assertEqual(self.detector.risk_parameters['max_recommended_edge'], 5.0)
+    
+    def test_analyze_edge_opportunities_empty(self):
+        """Test summary for an empty slate."""
+        analysis = self.detector.analyze_edge_opportunities([])
+        
+        self.assertEqual(analysis['total_games'], 0)
+        self.assertEqual(analysis['recommendations'], [])
+
+
+class TestFactorValidator(unittest.TestCase):
+    """Test factor validation statistics and verdicts."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.validator = FactorValidator()
+        
+        self.spread_factor = Mock()
+        self.spread_factor.activation_threshold = 0.5
+        self.spread_factor._min_output = -5.0
+        self.spread_factor._max_output = 5.0
+        self.spread_factor.calculate.side_effect = (
+            lambda home, away, context: context['vegas_spread'] / 10 + context['week'] * 0.05
+        )
+        
+        self.constant_factor = Mock()
+        self.constant_factor.activation_threshold = 0.5
+        self.constant_factor._min_output = -5.0
+        self.constant_factor._max_output = 5.0
+        self.constant_factor.calculate.return_value = 1.25
+    
+    def test_varied_factor_statistics(self):
+        """Test statistics reported for a factor with realistic variation."""
+        result = self.validator.validate_single_factor('Spread', self.spread_factor)
+        tests = result['tests']
+        
+        self.assertEqual(tests['uniformity_test']['result'], ValidationResult.PASS)
+        self.assertEqual(tests['variety_test']['result'], ValidationResult.PASS)
+        self.assertEqual(tests['range_compliance_test']['result'], ValidationResult.PASS)
+        self.assertEqual(tests['consistency_test']['result'], ValidationResult.PASS)
+        self.assertEqual(tests['uniformity_test']['total_values'], len(self.validator.test_scenarios))
+        self.assertAlmostEqual(tests['range_compliance_test']['actual_range'][0], -4.1)
+    
+    def test_uniform_factor_fails(self):
+        """Test that a constant factor is flagged as uniform."""
+        result = self.validator.validate_single_factor('Constant', self.constant_factor)
+        tests = result['tests']
+        
+        self.assertEqual(tests['uniformity_test']['result'], ValidationResult.FAIL)
+        self.assertEqual(tests['uniformity_test']['coefficient_of_variation'], 0.0)
+        self.assertEqual(tests['variety_test']['unique_values'], 1)
+        self.assertEqual(result['overall_result'], ValidationResult.FAIL)
+    
+    def test_output_stats_match_statistics(self):
+        """Test the single-pass output statistics."""
+        import statistics
+        values = [1.5, -0.25, 3.0, 0.0, 2.125]
+        outputs = FactorOutputs(
+            scenarios=[{}] * len(values),
+            scenario_codes=[0, 0, 1, 1, 1],
+            values=values,
+            is_zero=[abs(v) < 1e-10 for v in values],
+            is_activated=[abs(v) > 0.5 for v in values]
+        )
+        
+        stats = outputs.stats
+        
+        self.assertAlmostEqual(stats.mean, statistics.mean(values))
+        self.assertAlmostEqual(stats.std_dev, statistics.stdev(values))
+        self.assertAlmostEqual(stats.nonzero_std_dev, statistics.stdev([1.5, -0.25, 3.0, 2.125]))
+        self.assertEqual((stats.min_value, stats.max_value), (-0.25, 3.0))
+        self.assertEqual((stats.zero_count, stats.activated_count), (1, 3))
+        self.assertEqual(stats.unique_values, 5)
+        self.assertAlmostEqual(stats.by_scenario_type['week_variation'][1], statistics.mean([3.0, 0.0, 2.125]))
+        self.assertIs(outputs.stats, stats)
+    
+    def test_failed_scenarios_skipped_in_outputs(self):
+        """Test that scenarios a factor cannot calculate are left out of the outputs."""
+        factor = Mock()
+        factor.activation_threshold = 0.5
+        factor.calculate.side_effect = (
+            lambda home, away, context: None if context['week'] == 1 else context['week'] / 10
+        )
+        
+        outputs = self.validator._generate_test_outputs(factor, 'Week')
+        records = outputs.to_records()
+        
+        self.assertEqual(len(outputs), len(self.validator.test_scenarios) - 1)
+        self.assertNotIn(1, [record['context']['week'] for record in records])
+        self.assertEqual([record['value'] for record in records], outputs.values)
+        self.assertEqual(outputs.is_activated, [value > 0.5 for value in outputs.values])
+    
+    def test_validate_all_factors(self):
+        """Test that concurrent validation reports every factor in registry order."""
+        failing_factor = Mock()
+        failing_factor.calculate.side_effect = ValueError('no data')
+        factors = {
+            'Spread': self.spread_factor,
+            'Constant': self.constant_factor,
+            'Failing': failing_factor
+        }
+        
+        with patch('engine.factor_validator.factor_registry') as registry:
+            registry.factors = factors
+            results = self.validator.validate_all_factors(max_workers=2)
+        
+        individual = results['individual_factors']
+        self.assertEqual(list(individual), list(factors))
+        self.assertEqual(individual['Constant']['overall_result'], ValidationResult.FAIL)
+        self.assertEqual(individual['Failing']['error'], 'No valid outputs generated')
+        self.assertEqual(results['system_summary']['total_factors'], 3)
+    
+    def test_repeated_inputs_use_cached_output(self):
+        """Test that identical inputs to a deterministic factor are calculated once."""
+        self.spread_factor.is_deterministic = True
+        context = {'vegas_spread': -3.5, 'week': 8, 'year': 2024}
+        
+        first = self.validator._cached_calc(self.spread_factor, 'Spread', 'Iowa', 'Purdue', context)
+        second = self.validator._cached_calc(self.spread_factor, 'Spread', 'Iowa', 'Purdue', dict(context))
+        
+        self.assertEqual(first, second)
+        self.assertEqual(self.spread_factor.calculate.call_count, 1)
+    
+    def test_non_deterministic_and_unhashable_inputs_not_cached(self):
+        """Test that undeclared factors and unhashable contexts are always recalculated."""
+        context = {'vegas_spread': -3.5, 'week': 8, 'year': 2024}
+        self.validator._cached_calc(self.spread_factor, 'Spread', 'Iowa', 'Purdue', context)
+        self.validator._cached_calc(self.spread_factor, 'Spread', 'Iowa', 'Purdue', context)
+        self.assertEqual(self.spread_factor.calculate.call_count, 2)
+        
+        self.spread_factor.is_deterministic = True
+        nested = dict(context, injuries=['QB'])
+        self.validator._cached_calc(self.spread_factor, 'Spread', 'Iowa', 'Purdue', nested)
+        self.validator._cached_calc(self.spread_factor, 'Spread', 'Iowa', 'Purdue', nested)
+        self.assertEqual(self.spread_factor.calculate.call_count, 4)
+    
+    def test_revalidation_does_not_reuse_outputs(self):
+        """Test that validating a factor again recalculates its outputs."""
+        self.spread_factor.is_deterministic = True
+        self.validator.validate_single_factor('Spread', self.spread_factor)
+        self.spread_factor.calculate.side_effect = lambda home, away, context: 2.0
+        
+        result = self.validator.validate_single_factor('Spread', self.spread_factor)
+        
+        self.assertEqual(set(result['outputs'].values), {2.0})
+        self.assertEqual(set(result['tests']['edge_case_test']['edge_case_values']), {2.0})
+    
+    def test_deterministic_factor_spot_checked_once(self):
+        """Test that a factor declared deterministic is recalculated only once."""
+        self.spread_factor.is_deterministic = True
+        outputs = self.validator._generate_test_outputs(self.spread_factor, 'Spread')
+        calls_before = self.spread_factor.calculate.call_count
+        
+        result = self.validator._test_deterministic_consistency(outputs, self.spread_factor, 'Spread')
+        
+        self.assertEqual(result['result'], ValidationResult.PASS)
+        self.assertEqual(result['tests_performed'], 1)
+        self.assertEqual(self.spread_factor.calculate.call_count, calls_before + 1)
+    
+    def test_batch_factor_calculated_in_one_call(self):
+        """Test that factors implementing calculate_batch skip per-scenario calls."""
+        class BatchFactor:
+            activation_threshold = 0.5
+            
+            def __init__(self):
+                self.calculate = Mock(return_value=0.0)
+                self.batch_calls = 0
+            
+            def calculate_batch(self, home_teams, away_teams, contexts):
+                self.batch_calls += 1
+                return [context['vegas_spread'] / 10 for context in contexts]
+        
+        factor = BatchFactor()
+        outputs = self.validator._generate_test_outputs(factor, 'Batch')
+        
+        self.assertEqual(factor.batch_calls, 1)
+        factor.calculate.assert_not_called()
+        self.assertEqual(outputs.values,
+                         [s['context']['vegas_spread'] / 10 for s in self.validator.test_scenarios])
+    
+    def test_edge_case_extremes_exercised(self):
+        """Test that edge cases beyond every scenario are calculated with their own inputs."""
+        outputs = self.validator._generate_test_outputs(self.spread_factor, 'Spread')
+        self.spread_factor.calculate.reset_mock()
+        
+        result = self.validator._test_edge_case_handling(outputs, self.spread_factor, 'Spread')
+        
+        calculated = [call.args[2] for call in self.spread_factor.calculate.call_args_list]
+        self.assertEqual(result['result'], ValidationResult.PASS)
+        self.assertEqual(len(result['edge_case_values']), 4)
+        self.assertIn(-49.5, [context['vegas_spread'] for context in calculated])
+        self.assertIn(14, [context['week'] for context in calculated])
+    
+    def test_range_violations_reported(self):
+        """Test that out-of-range outputs are counted with examples."""
+        self.spread_factor._max_output = 1.0
+        
+        result = self.validator.validate_single_factor('Spread', self.spread_factor)
+        range_test = result['tests']['range_compliance_test']
+        
+        self.assertEqual(range_test['result'], ValidationResult.FAIL)
+        self.assertEqual(range_test['violations'], 2)
+        self.assertEqual(len(range_test['violation_examples']), 2)
+
+    def test_pressure_factor_does_not_mutate_context(self):
+        """Test that a cached pressure factor cannot leak team names between calls."""
+        context = {
+            'week': 12,
+            'vegas_spread': -3.0,
+            'home_team_data': {'derived_metrics': {'current_record': {'win_percentage': 0.7}}},
+            'away_team_data': {'derived_metrics': {'current_record': {'win_percentage': 0.5}}},
+        }
+        calculator = PressureSituationCalculator()
+        calculator.calculate('GEORGIA', 'ALABAMA', context)
+        
+        self.assertNotIn('team_name', context['home_team_data'])
+        self.assertNotIn('team_name', context['away_team_data'])
+        self.assertEqual(calculator.calculate('TEXAS', 'MICHIGAN', context),
+                         PressureSituationCalculator().calculate('TEXAS', 'MICHIGAN', copy.deepcopy(context)))
 
 
 if __name__ == '__main__':